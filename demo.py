@@ -2,186 +2,243 @@
 """
 Demo script for the Python Learning Game.
 Shows the game features and capabilities.
+
+Usage:
+    python demo.py               # Run all demo sections
+    python demo.py --list        # List sections and exit
+    python demo.py --skip-core   # Skip the core features section
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+def _write_lines(lines):
+    """Write a section's output lines with a single stdout write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 def demo_core_features():
     """Demonstrate core game features."""
-    print("🎮 Python Learning Game - Core Features Demo")
-    print("=" * 50)
-    
-    from core.config import Config
-    from core.grid import Grid, TileType
-    from core.player import Player
-    from core.level import Level
-    from core.code_executor import CodeExecutor
-    
-    # Initialize game components
-    config = Config()
-    grid = Grid(5, 5)
-    player = Player(0, 0, "north")
-    executor = CodeExecutor(config)
-    
-    print(f"✓ Game initialized with {config.WINDOW_WIDTH}x{config.WINDOW_HEIGHT} window")
-    print(f"✓ Grid size: {config.GRID_SIZE}x{config.GRID_SIZE}")
-    print(f"✓ Player starts at position {player.get_position()} facing {player.get_direction().value}")
-    
-    # Demo level creation
-    level = Level(
-        start_pos=(0, 0),
-        goal_pos=(4, 4),
-        obstacles=[(2, 2), (2, 3)],
-        gems=[(1, 1), (3, 3)],
-        grid_size=5,
-        hint="Navigate around obstacles and collect gems!"
-    )
-    
-    print(f"✓ Level created: {level.name}")
-    print(f"  - Start: {level.start_pos}")
-    print(f"  - Goal: {level.goal_pos}")
-    print(f"  - Obstacles: {len(level.obstacles)}")
-    print(f"  - Gems: {len(level.gems)}")
-    print(f"  - Hint: {level.get_hint()}")
-    
-    # Demo player movement
-    print("\n🤖 Player Movement Demo:")
-    print(f"  Initial position: {player.get_position()}")
-    
-    player.move_forward()
-    print(f"  After move_forward(): {player.get_position()}")
-    
-    player.turn_right()
-    print(f"  After turn_right(): facing {player.get_direction().value}")
-    
-    player.move_forward()
-    print(f"  After another move_forward(): {player.get_position()}")
-    
-    # Demo code execution
-    print("\n💻 Code Execution Demo:")
-    
-    # Valid code
-    valid_code = """
+    lines = []
+    try:
+        lines.append("🎮 Python Learning Game - Core Features Demo")
+        lines.append("=" * 50)
+        
+        from core.config import Config
+        from core.grid import Grid, TileType
+        from core.player import Player
+        from core.level import Level
+        from core.code_executor import CodeExecutor
+        
+        # Initialize game components
+        config = Config()
+        grid = Grid(5, 5)
+        player = Player(0, 0, "north")
+        executor = CodeExecutor(config)
+        
+        lines.append(f"✓ Game initialized with {config.WINDOW_WIDTH}x{config.WINDOW_HEIGHT} window")
+        lines.append(f"✓ Grid size: {config.GRID_SIZE}x{config.GRID_SIZE}")
+        lines.append(f"✓ Player starts at position {player.get_position()} facing {player.get_direction().value}")
+        
+        # Demo level creation
+        level = Level(
+            start_pos=(0, 0),
+            goal_pos=(4, 4),
+            obstacles=[(2, 2), (2, 3)],
+            gems=[(1, 1), (3, 3)],
+            grid_size=5,
+            hint="Navigate around obstacles and collect gems!"
+        )
+        
+        lines.append(f"✓ Level created: {level.name}")
+        lines.append(f"  - Start: {level.start_pos}")
+        lines.append(f"  - Goal: {level.goal_pos}")
+        lines.append(f"  - Obstacles: {len(level.obstacles)}")
+        lines.append(f"  - Gems: {len(level.gems)}")
+        lines.append(f"  - Hint: {level.get_hint()}")
+        
+        # Demo player movement
+        lines.append("\n🤖 Player Movement Demo:")
+        lines.append(f"  Initial position: {player.get_position()}")
+        
+        player.move_forward()
+        lines.append(f"  After move_forward(): {player.get_position()}")
+        
+        player.turn_right()
+        lines.append(f"  After turn_right(): facing {player.get_direction().value}")
+        
+        player.move_forward()
+        lines.append(f"  After another move_forward(): {player.get_position()}")
+        
+        # Demo code execution
+        lines.append("\n💻 Code Execution Demo:")
+        
+        # Valid code
+        valid_code = """
 # Simple movement sequence
 move_forward()
 turn_right()
 move_forward()
 """
-    
-    print("  Testing valid code:")
-    print("  " + valid_code.strip().replace('\n', '\n  '))
-    
-    result = executor.execute_code(valid_code, player, grid)
-    if result["success"]:
-        print("  ✓ Code executed successfully!")
-        print(f"  Actions performed: {result['actions']}")
-    else:
-        print(f"  ✗ Code execution failed: {result['error']}")
-    
-    # Invalid code
-    invalid_code = "import os\nos.system('rm -rf /')"
-    print("\n  Testing invalid code (security test):")
-    print("  " + invalid_code)
-    
-    if executor.validate_code(invalid_code):
-        print("  ✗ Security check failed!")
-    else:
-        print("  ✓ Security check passed - dangerous code blocked!")
+        
+        lines.append("  Testing valid code:")
+        lines.append("  " + valid_code.strip().replace('\n', '\n  '))
+        
+        result = executor.execute_code(valid_code, player, grid)
+        if result.success:
+            lines.append("  ✓ Code executed successfully!")
+            lines.append(f"  Actions performed: {result.actions}")
+        else:
+            lines.append(f"  ✗ Code execution failed: {result.error}")
+        
+        # Invalid code
+        invalid_code = "import os\nos.system('rm -rf /')"
+        lines.append("\n  Testing invalid code (security test):")
+        lines.append("  " + invalid_code)
+        
+        if executor.validate_code(invalid_code):
+            lines.append("  ✗ Security check failed!")
+        else:
+            lines.append("  ✓ Security check passed - dangerous code blocked!")
+    finally:
+        _write_lines(lines)
+
+@lru_cache(maxsize=4)
+def _get_loader(levels_dir):
+    """Load all levels from levels_dir once and reuse the loader."""
+    from levels.level_loader import LevelLoader
+    return LevelLoader(Path(levels_dir))
 
 def demo_level_system():
     """Demonstrate the level system."""
-    print("\n📚 Level System Demo:")
-    print("=" * 30)
-    
-    from levels.level_loader import LevelLoader
-    
-    # Create level loader
-    levels_dir = Path(__file__).parent / "src" / "levels"
-    loader = LevelLoader(levels_dir)
-    
-    print(f"✓ Loaded {loader.get_level_count()} levels")
-    
-    # Show first few levels
-    for i in range(min(3, loader.get_level_count())):
-        level = loader.get_level(i)
-        if level:
-            print(f"  Level {i+1}: {level.name}")
-            print(f"    Hint: {level.get_hint()}")
+    lines = []
+    try:
+        lines.append("\n📚 Level System Demo:")
+        lines.append("=" * 30)
+        
+        # Get (cached) level loader
+        levels_dir = Path(__file__).parent / "src" / "levels"
+        loader = _get_loader(str(levels_dir))
+        
+        lines.append(f"✓ Loaded {loader.get_level_count()} levels")
+        
+        # Show first few levels
+        for i in range(min(3, loader.get_level_count())):
+            level = loader.get_level(i)
+            if level:
+                lines.append(f"  Level {i+1}: {level.name}")
+                lines.append(f"    Hint: {level.get_hint()}")
+    finally:
+        _write_lines(lines)
 
 def demo_ui_features():
     """Demonstrate UI features."""
-    print("\n🖥️  UI Features Demo:")
-    print("=" * 25)
-    
-    print("✓ Split-screen interface:")
-    print("  - Left: Game view with grid and player")
-    print("  - Right: Code editor with syntax highlighting")
-    print("✓ Code editor features:")
-    print("  - Syntax highlighting")
-    print("  - Run/Clear/Save/Load buttons")
-    print("  - Keyboard shortcuts (Ctrl+R, Ctrl+S, etc.)")
-    print("  - Help system with function reference")
-    print("✓ Game controls:")
-    print("  - Start/Pause/Reset buttons")
-    print("  - Real-time level info display")
-    print("  - Hint system")
-    print("✓ Output console:")
-    print("  - Code execution results")
-    print("  - Error messages")
-    print("  - Status updates")
+    lines = []
+    lines.append("\n🖥️  UI Features Demo:")
+    lines.append("=" * 25)
+    
+    lines.append("✓ Split-screen interface:")
+    lines.append("  - Left: Game view with grid and player")
+    lines.append("  - Right: Code editor with syntax highlighting")
+    lines.append("✓ Code editor features:")
+    lines.append("  - Syntax highlighting")
+    lines.append("  - Run/Clear/Save/Load buttons")
+    lines.append("  - Keyboard shortcuts (Ctrl+R, Ctrl+S, etc.)")
+    lines.append("  - Help system with function reference")
+    lines.append("✓ Game controls:")
+    lines.append("  - Start/Pause/Reset buttons")
+    lines.append("  - Real-time level info display")
+    lines.append("  - Hint system")
+    lines.append("✓ Output console:")
+    lines.append("  - Code execution results")
+    lines.append("  - Error messages")
+    lines.append("  - Status updates")
+    
+    _write_lines(lines)
 
 def demo_educational_features():
     """Demonstrate educational features."""
-    print("\n🎓 Educational Features Demo:")
-    print("=" * 35)
-    
-    print("✓ Progressive Learning Path:")
-    print("  - 60+ levels from beginner to expert")
-    print("  - Sequential command learning")
-    print("  - Loop introduction (for/while)")
-    print("  - Conditional logic (if/else)")
-    print("  - Function definition")
-    print("  - Data structures (lists, dicts)")
-    print("  - Advanced algorithms")
-    
-    print("✓ Safe Code Execution:")
-    print("  - AST-based code validation")
-    print("  - Whitelisted functions only")
-    print("  - No file system access")
-    print("  - No network access")
-    print("  - No dangerous imports")
-    
-    print("✓ Learning Tools:")
-    print("  - Interactive hints")
-    print("  - Step-by-step tutorials")
-    print("  - Code examples")
-    print("  - Achievement system")
-    print("  - Progress tracking")
+    lines = []
+    lines.append("\n🎓 Educational Features Demo:")
+    lines.append("=" * 35)
+    
+    lines.append("✓ Progressive Learning Path:")
+    lines.append("  - 60+ levels from beginner to expert")
+    lines.append("  - Sequential command learning")
+    lines.append("  - Loop introduction (for/while)")
+    lines.append("  - Conditional logic (if/else)")
+    lines.append("  - Function definition")
+    lines.append("  - Data structures (lists, dicts)")
+    lines.append("  - Advanced algorithms")
+    
+    lines.append("✓ Safe Code Execution:")
+    lines.append("  - AST-based code validation")
+    lines.append("  - Whitelisted functions only")
+    lines.append("  - No file system access")
+    lines.append("  - No network access")
+    lines.append("  - No dangerous imports")
+    
+    lines.append("✓ Learning Tools:")
+    lines.append("  - Interactive hints")
+    lines.append("  - Step-by-step tutorials")
+    lines.append("  - Code examples")
+    lines.append("  - Achievement system")
+    lines.append("  - Progress tracking")
+    
+    _write_lines(lines)
 
-def main():
+# Demo sections in run order; only "core" constructs game objects
+SECTIONS = {
+    "core": demo_core_features,
+    "levels": demo_level_system,
+    "ui": demo_ui_features,
+    "education": demo_educational_features,
+}
+
+def parse_args(argv=None):
+    """Parse command-line options (argparse is imported only here)."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Python Learning Game feature demo")
+    parser.add_argument("--list", action="store_true",
+                        help="list demo sections and exit without loading the game")
+    parser.add_argument("--skip-core", action="store_true",
+                        help="skip the core features section (no game objects are created)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Run the complete demo."""
-    print("🚀 Python Learning Game - Complete Demo")
-    print("=" * 50)
-    print("A comprehensive Python learning game with progressive levels")
-    print("from beginner to expert, featuring safe code execution")
-    print("and interactive gameplay.")
-    print()
+    args = parse_args(argv)
+    
+    # Early exit: nothing from core/ or levels/ is imported
+    if args.list:
+        _write_lines([f"  {name}" for name in SECTIONS])
+        return
+    
+    _write_lines([
+        "🚀 Python Learning Game - Complete Demo",
+        "=" * 50,
+        "A comprehensive Python learning game with progressive levels",
+        "from beginner to expert, featuring safe code execution",
+        "and interactive gameplay.",
+        "",
+    ])
     
     try:
-        demo_core_features()
-        demo_level_system()
-        demo_ui_features()
-        demo_educational_features()
-        
-        print("\n🎉 Demo completed successfully!")
-        print("\nTo run the actual game:")
-        print("  python main.py")
-        print("\nTo run tests:")
-        print("  python test_game.py")
+        for name, section in SECTIONS.items():
+            if name == "core" and args.skip_core:
+                continue
+            section()
+        
+        _write_lines([
+            "\n🎉 Demo completed successfully!",
+            "\nTo run the actual game:",
+            "  python main.py",
+            "\nTo run tests:",
+            "  python test_game.py",
+        ])
         
     except Exception as e:
         print(f"\n❌ Demo failed: {e}")
@@ -4,6 +4,9 @@ Sprite Generator for Python Learning Game
 Generates pixel art sprites for the game characters, tiles, and objects.
 """
 
+import json
+import math
+import numpy as np
 import pygame
 import sys
 from pathlib import Path
@@ -18,6 +21,11 @@ SPRITES_DIR.mkdir(parents=True, exist_ok=True)
 # Sprite size
 TILE_SIZE = 64  # Base tile size for high quality
 
+# Texture atlas (all sprites packed into one PNG + JSON index)
+ATLAS_SIZE = 1024
+ATLAS_IMAGE = "atlas.png"
+ATLAS_INDEX = "atlas.json"
+
 # Color palette (cute pixel art style)
 COLORS = {
     'player_blue': (52, 152, 219),
@@ -39,9 +47,23 @@ COLORS = {
     'goal_light': (125, 206, 160),
     'black': (0, 0, 0),
     'white': (255, 255, 255),
-    'transparent': (255, 0, 255),
 }
 
+# Robot eyes per facing direction: (pupil x offset from head, highlight dx, highlight dy)
+# The highlight shifts one pixel toward where the robot is looking
+_EYE_OFFSETS = {
+    'north': ((6, 0, -1), (14, 0, -1)),
+    'south': ((6, 0, 1), (14, 0, 1)),
+    'east': ((8, 1, 0), (16, 1, 0)),
+    'west': ((4, -1, 0), (12, -1, 0)),
+}
+
+# Unit vectors for the goal's 5-point star (first point straight up)
+_STAR_UNIT = tuple(
+    (math.cos(math.pi * 2 * i / 5 - math.pi / 2), math.sin(math.pi * 2 * i / 5 - math.pi / 2))
+    for i in range(5)
+)
+
 
 def draw_pixel_rect(surface, color, x, y, width=1, height=1):
     """Draw a pixel-perfect rectangle."""
@@ -50,9 +72,7 @@ def draw_pixel_rect(surface, color, x, y, width=1, height=1):
 
 def create_player_sprite(direction='north', frame=0):
     """Create a cute robot player sprite facing the given direction."""
-    surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
-    surface.fill(COLORS['transparent'])
-    surface.set_colorkey(COLORS['transparent'])
+    surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)  # Starts fully transparent
     
     # Animation offset for idle animation
     bob_offset = 0 if frame == 0 else 1
@@ -89,35 +109,11 @@ def create_player_sprite(direction='north', frame=0):
     draw_pixel_rect(surface, COLORS['player_dark'], antenna_x, antenna_y, 2, 6)
     pygame.draw.circle(surface, COLORS['gem_yellow'], (antenna_x + 1, antenna_y - 1), 3)
     
-    # Eyes based on direction
-    if direction == 'north':
-        eye_y = head_y + 6
-        # Two eyes looking up
-        pygame.draw.circle(surface, COLORS['player_eye'], (head_x + 6, eye_y), 3)
-        pygame.draw.circle(surface, COLORS['player_eye'], (head_x + 14, eye_y), 3)
-        pygame.draw.circle(surface, COLORS['white'], (head_x + 6, eye_y - 1), 1)
-        pygame.draw.circle(surface, COLORS['white'], (head_x + 14, eye_y - 1), 1)
-    elif direction == 'south':
-        eye_y = head_y + 6
-        # Two eyes looking down
-        pygame.draw.circle(surface, COLORS['player_eye'], (head_x + 6, eye_y), 3)
-        pygame.draw.circle(surface, COLORS['player_eye'], (head_x + 14, eye_y), 3)
-        pygame.draw.circle(surface, COLORS['white'], (head_x + 6, eye_y + 1), 1)
-        pygame.draw.circle(surface, COLORS['white'], (head_x + 14, eye_y + 1), 1)
-    elif direction == 'east':
-        eye_y = head_y + 6
-        # Two eyes looking right
-        pygame.draw.circle(surface, COLORS['player_eye'], (head_x + 8, eye_y), 3)
-        pygame.draw.circle(surface, COLORS['player_eye'], (head_x + 16, eye_y), 3)
-        pygame.draw.circle(surface, COLORS['white'], (head_x + 9, eye_y), 1)
-        pygame.draw.circle(surface, COLORS['white'], (head_x + 17, eye_y), 1)
-    elif direction == 'west':
-        eye_y = head_y + 6
-        # Two eyes looking left
-        pygame.draw.circle(surface, COLORS['player_eye'], (head_x + 4, eye_y), 3)
-        pygame.draw.circle(surface, COLORS['player_eye'], (head_x + 12, eye_y), 3)
-        pygame.draw.circle(surface, COLORS['white'], (head_x + 3, eye_y), 1)
-        pygame.draw.circle(surface, COLORS['white'], (head_x + 11, eye_y), 1)
+    # Eyes based on direction (pupil + highlight for each eye)
+    eye_y = head_y + 6
+    for dark_dx, white_dx, white_dy in _EYE_OFFSETS[direction]:
+        pygame.draw.circle(surface, COLORS['player_eye'], (head_x + dark_dx, eye_y), 3)
+        pygame.draw.circle(surface, COLORS['white'], (head_x + dark_dx + white_dx, eye_y + white_dy), 1)
     
     # Arms/wheels
     wheel_y = body_y + body_height - 8
@@ -133,14 +129,17 @@ def create_player_sprite(direction='north', frame=0):
 
 def create_floor_tile():
     """Create a floor tile sprite."""
-    surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
-    surface.fill(COLORS['floor_light'])
+    # Pixel array indexed [x, y, rgb] (surfarray layout)
+    arr = np.empty((TILE_SIZE, TILE_SIZE, 3), np.uint8)
+    arr[:] = COLORS['floor_light']
     
-    # Add some subtle pattern
-    for i in range(0, TILE_SIZE, 8):
-        for j in range(0, TILE_SIZE, 8):
-            if (i + j) % 16 == 0:
-                draw_pixel_rect(surface, COLORS['floor_dark'], i, j, 4, 4)
+    # Add some subtle pattern: 4x4 dark squares on every other 8x8 cell
+    coords = np.arange(TILE_SIZE)
+    in_square = (coords % 8) < 4
+    even_cell = ((coords[:, None] // 8 + coords[None, :] // 8) % 2) == 0
+    arr[in_square[:, None] & in_square[None, :] & even_cell] = COLORS['floor_dark']
+    
+    surface = pygame.surfarray.make_surface(arr)
     
     # Border
     pygame.draw.rect(surface, COLORS['floor_dark'], (0, 0, TILE_SIZE, TILE_SIZE), 1)
@@ -150,16 +149,16 @@ def create_floor_tile():
 
 def create_grass_tile():
     """Create a grass tile sprite (alternative floor)."""
-    surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
-    surface.fill(COLORS['grass_green'])
+    arr = np.empty((TILE_SIZE, TILE_SIZE, 3), np.uint8)
+    arr[:] = COLORS['grass_green']
+    
+    # Add grass blades (2x3 pixels each), all 20 positions in one RNG call
+    rng = np.random.default_rng(42)  # Consistent grass pattern
+    blades = rng.integers(2, TILE_SIZE - 3, size=(20, 2))  # x, y in [2, TILE_SIZE - 4]
+    for x, y in blades:
+        arr[x:x + 2, y:y + 3] = COLORS['grass_dark']
     
-    # Add grass blades
-    import random
-    random.seed(42)  # Consistent grass pattern
-    for _ in range(20):
-        x = random.randint(2, TILE_SIZE - 4)
-        y = random.randint(2, TILE_SIZE - 4)
-        draw_pixel_rect(surface, COLORS['grass_dark'], x, y, 2, 3)
+    surface = pygame.surfarray.make_surface(arr)
     
     # Border
     pygame.draw.rect(surface, COLORS['grass_dark'], (0, 0, TILE_SIZE, TILE_SIZE), 1)
@@ -193,9 +192,7 @@ def create_wall_tile():
 
 def create_gem_sprite(frame=0):
     """Create a gem sprite with animation frames."""
-    surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
-    surface.fill(COLORS['transparent'])
-    surface.set_colorkey(COLORS['transparent'])
+    surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)  # Starts fully transparent
     
     center_x = TILE_SIZE // 2
     center_y = TILE_SIZE // 2
@@ -242,9 +239,7 @@ def create_gem_sprite(frame=0):
 
 def create_goal_sprite(frame=0):
     """Create a goal tile sprite with animation."""
-    surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
-    surface.fill(COLORS['transparent'])
-    surface.set_colorkey(COLORS['transparent'])
+    surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)  # Starts fully transparent
     
     center_x = TILE_SIZE // 2
     center_y = TILE_SIZE // 2
@@ -253,28 +248,22 @@ def create_goal_sprite(frame=0):
     pulse = [0, 2, 4, 2][frame % 4]
     size = 24 + pulse
     
-    # Outer glow
+    # Outer glow: one per-pixel-alpha scratch surface, cleared for each ring
+    max_glow = size + 12
+    glow = pygame.Surface((max_glow * 2, max_glow * 2), pygame.SRCALPHA)
     for i in range(3):
         alpha_size = size + (3 - i) * 4
-        s = pygame.Surface((alpha_size * 2, alpha_size * 2))
-        s.fill(COLORS['transparent'])
-        s.set_colorkey(COLORS['transparent'])
-        s.set_alpha(50 - i * 15)
-        pygame.draw.circle(s, COLORS['goal_light'], (alpha_size, alpha_size), alpha_size)
-        surface.blit(s, (center_x - alpha_size, center_y - alpha_size))
+        glow.fill((0, 0, 0, 0))
+        pygame.draw.circle(glow, (*COLORS['goal_light'], 50 - i * 15), (max_glow, max_glow), alpha_size)
+        surface.blit(glow, (center_x - max_glow, center_y - max_glow))
     
     # Main goal
     pygame.draw.circle(surface, COLORS['goal_green'], (center_x, center_y), size)
     pygame.draw.circle(surface, COLORS['goal_dark'], (center_x, center_y), size, 3)
     
     # Inner star/checkmark pattern
-    star_points = []
-    import math
-    for i in range(5):
-        angle = math.pi * 2 * i / 5 - math.pi / 2
-        x = center_x + math.cos(angle) * (size - 8)
-        y = center_y + math.sin(angle) * (size - 8)
-        star_points.append((x, y))
+    radius = size - 8
+    star_points = [(center_x + ux * radius, center_y + uy * radius) for ux, uy in _STAR_UNIT]
     
     pygame.draw.polygon(surface, COLORS['goal_light'], star_points)
     pygame.draw.polygon(surface, COLORS['goal_dark'], star_points, 2)
@@ -284,9 +273,7 @@ def create_goal_sprite(frame=0):
 
 def create_particle_sprite(color_name='gem_yellow'):
     """Create a small particle sprite."""
-    surface = pygame.Surface((8, 8))
-    surface.fill(COLORS['transparent'])
-    surface.set_colorkey(COLORS['transparent'])
+    surface = pygame.Surface((8, 8), pygame.SRCALPHA)
     
     pygame.draw.circle(surface, COLORS[color_name], (4, 4), 3)
     pygame.draw.circle(surface, COLORS['white'], (3, 3), 1)
@@ -294,55 +281,89 @@ def create_particle_sprite(color_name='gem_yellow'):
     return surface
 
 
+def pack_atlas(sprites):
+    """
+    Pack named sprites into a single texture atlas.
+    
+    Uses a simple shelf (row) packer: sprites are placed left to right
+    and a new row starts when the current one is full.
+    
+    Args:
+        sprites: List of (name, surface) pairs, in packing order
+    
+    Returns:
+        (atlas, index) where atlas is an SRCALPHA Surface cropped to the
+        used height and index maps name -> [x, y, w, h]
+    """
+    atlas = pygame.Surface((ATLAS_SIZE, ATLAS_SIZE), pygame.SRCALPHA)
+    index = {}
+    
+    cursor_x, cursor_y, row_height = 0, 0, 0
+    for name, sprite in sprites:
+        width, height = sprite.get_size()
+        
+        # Start a new shelf when this sprite doesn't fit on the current one
+        if cursor_x + width > ATLAS_SIZE:
+            cursor_x = 0
+            cursor_y += row_height
+            row_height = 0
+        if cursor_y + height > ATLAS_SIZE:
+            raise ValueError(f"Atlas full: cannot place {name}")
+        
+        # Copy pixels as-is: a normal alpha blit onto the transparent atlas
+        # would premultiply (darken) semi-transparent glow/shadow pixels
+        atlas.blit(sprite, (cursor_x, cursor_y), special_flags=pygame.BLEND_RGBA_MAX)
+        index[name] = [cursor_x, cursor_y, width, height]
+        
+        cursor_x += width
+        row_height = max(row_height, height)
+    
+    # Drop the unused rows below the last shelf
+    used_height = cursor_y + row_height
+    return atlas.subsurface((0, 0, ATLAS_SIZE, used_height)).copy(), index
+
+
 def main():
-    """Generate all sprite assets."""
+    """Generate all sprite assets into a single texture atlas."""
     print("🎨 Generating pixel art sprites for Python Learning Game...")
     
+    sprites = []
+    
     # Player sprites (4 directions × 2 animation frames)
     directions = ['north', 'south', 'east', 'west']
     for direction in directions:
         for frame in range(2):
-            sprite = create_player_sprite(direction, frame)
-            filename = f"player_{direction}_{frame}.png"
-            pygame.image.save(sprite, SPRITES_DIR / filename)
-            print(f"  ✓ Created {filename}")
+            sprites.append((f"player_{direction}_{frame}", create_player_sprite(direction, frame)))
     
     # Tile sprites
-    tiles = [
-        ('floor', create_floor_tile()),
-        ('grass', create_grass_tile()),
-        ('wall', create_wall_tile()),
-    ]
-    
-    for name, sprite in tiles:
-        filename = f"tile_{name}.png"
-        pygame.image.save(sprite, SPRITES_DIR / filename)
-        print(f"  ✓ Created {filename}")
+    sprites.append(('tile_floor', create_floor_tile()))
+    sprites.append(('tile_grass', create_grass_tile()))
+    sprites.append(('tile_wall', create_wall_tile()))
     
     # Gem sprites (4 animation frames)
     for frame in range(4):
-        sprite = create_gem_sprite(frame)
-        filename = f"gem_{frame}.png"
-        pygame.image.save(sprite, SPRITES_DIR / filename)
-        print(f"  ✓ Created {filename}")
+        sprites.append((f"gem_{frame}", create_gem_sprite(frame)))
     
     # Goal sprites (4 animation frames)
     for frame in range(4):
-        sprite = create_goal_sprite(frame)
-        filename = f"goal_{frame}.png"
-        pygame.image.save(sprite, SPRITES_DIR / filename)
-        print(f"  ✓ Created {filename}")
+        sprites.append((f"goal_{frame}", create_goal_sprite(frame)))
     
     # Particle sprites
     particle_colors = ['gem_yellow', 'goal_green', 'player_blue']
     for color in particle_colors:
-        sprite = create_particle_sprite(color)
-        filename = f"particle_{color}.png"
-        pygame.image.save(sprite, SPRITES_DIR / filename)
-        print(f"  ✓ Created {filename}")
+        sprites.append((f"particle_{color}", create_particle_sprite(color)))
+    
+    # One PNG encode for everything, plus the lookup index
+    atlas, index = pack_atlas(sprites)
+    pygame.image.save(atlas, SPRITES_DIR / ATLAS_IMAGE)
+    with open(SPRITES_DIR / ATLAS_INDEX, 'w') as f:
+        json.dump(index, f, indent=2)
+    
+    for name in index:
+        print(f"  ✓ Packed {name}")
     
-    print(f"\n✨ All sprites generated successfully in {SPRITES_DIR}")
-    print(f"📊 Total sprites created: {len(list(SPRITES_DIR.glob('*.png')))}")
+    print(f"\n✨ All sprites generated successfully in {SPRITES_DIR / ATLAS_IMAGE}")
+    print(f"📊 Total sprites packed: {len(index)} (atlas {atlas.get_width()}x{atlas.get_height()})")
 
 
 if __name__ == "__main__":
@@ -15,113 +15,178 @@ Usage:
     python preview_levels.py 6-10      # Show levels 6 through 10
 """
 
+import io
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
+# orjson is an optional, faster JSON parser; both accept bytes
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Static output fragments, built once
+ROW_TEMPLATE = "  |%s|\n"
+LEGEND = (
+    "Legend:\n"
+    "  P = Player Start\n"
+    "  G = Goal\n"
+    "  # = Wall/Obstacle\n"
+    "  * = Gem\n"
+    "  . = Empty floor\n"
+)
+
+LEVELS_DIR = Path("src/levels")
+
+@lru_cache(maxsize=None)
+def level_files():
+    """Map level number -> JSON path for every level file (one directory scan)."""
+    files = {}
+    for path in LEVELS_DIR.glob("level_*.json"):
+        number = path.stem.split('_', 1)[1]
+        if number.isdigit():
+            files[int(number)] = path
+    return files
+
+@lru_cache(maxsize=None)
 def load_level(level_num):
-    """Load a level JSON file."""
-    level_path = Path(f"src/levels/level_{level_num:02d}.json")
-    if not level_path.exists():
+    """Load a level JSON file (cached; callers must not mutate the result)."""
+    level_path = level_files().get(level_num)
+    if level_path is None:
         return None
     
-    with open(level_path, 'r') as f:
-        return json.load(f)
+    return _json_loads(level_path.read_bytes())
 
 def visualize_level(level_data, level_num):
     """Create ASCII visualization of a level."""
     if not level_data:
         return f"❌ Level {level_num} not found"
     
+    buf = io.StringIO()
+    try:
+        _write_level(buf, level_data)
+    except ValueError as e:
+        return f"❌ Level {level_num}: {e}"
+    return buf.getvalue()
+
+def _coords(points):
+    """Parse a JSON list of [x, y] pairs into an (N, 2) integer array."""
+    return np.asarray(points, dtype=np.intp).reshape(-1, 2)
+
+def _place(cells, coords, grid_size, marker):
+    """Write marker into every in-bounds (x, y) cell of a flat grid view."""
+    xs, ys = coords[:, 0], coords[:, 1]
+    inside = (xs >= 0) & (xs < grid_size) & (ys >= 0) & (ys < grid_size)
+    cells[ys[inside] * grid_size + xs[inside]] = marker
+
+def _write_level(buf, level_data):
+    """
+    Write the ASCII visualization of a level into a text buffer.
+    
+    Raises ValueError (before writing anything) if the start or goal
+    lies outside the grid: on the flat grid it would otherwise wrap
+    around into another cell and draw a wrong preview.
+    """
     grid_size = level_data['grid_size']
     start = tuple(level_data['start_pos'])
     goal = tuple(level_data['goal_pos'])
-    obstacles = [tuple(obs) for obs in level_data.get('obstacles', [])]
-    gems = [tuple(gem) for gem in level_data.get('gems', [])]
     
-    # Build grid
-    grid = [['.' for _ in range(grid_size)] for _ in range(grid_size)]
+    for label, (x, y) in (("start_pos", start), ("goal_pos", goal)):
+        if not (0 <= x < grid_size and 0 <= y < grid_size):
+            raise ValueError(f"{label} ({x}, {y}) is outside the "
+                             f"{grid_size}x{grid_size} grid")
+    
+    # Coordinates as (N, 2) arrays of [x, y]
+    obstacles = _coords(level_data.get('obstacles', []))
+    gems = _coords(level_data.get('gems', []))
     
-    # Place elements
-    for x, y in obstacles:
-        if 0 <= x < grid_size and 0 <= y < grid_size:
-            grid[y][x] = '#'
+    # Build grid as a flat row-major byte buffer: cells[y * grid_size + x]
+    cells = bytearray(b'.' * (grid_size * grid_size))
+    cell_view = np.frombuffer(cells, dtype=np.uint8)  # Writable view, no copy
     
-    for x, y in gems:
-        if 0 <= x < grid_size and 0 <= y < grid_size:
-            grid[y][x] = '*'
+    # Place elements (gems drawn after walls, so they win on overlap)
+    _place(cell_view, obstacles, grid_size, ord('#'))
+    _place(cell_view, gems, grid_size, ord('*'))
     
     # Place goal (may overwrite gem)
-    grid[goal[1]][goal[0]] = 'G'
+    cells[goal[1] * grid_size + goal[0]] = ord('G')
     
     # Place player start (may overwrite goal if same position)
     if start == goal:
-        grid[start[1]][start[0]] = 'S'  # Start and goal same
+        cells[start[1] * grid_size + start[0]] = ord('S')  # Start and goal same
     else:
-        grid[start[1]][start[0]] = 'P'
+        cells[start[1] * grid_size + start[0]] = ord('P')
     
-    # Create output
-    output = []
-    output.append("=" * 60)
-    output.append(f"📚 {level_data['name']}")
-    output.append("=" * 60)
-    output.append("")
+    separator = "=" * 60 + "\n"
+    border = "  +" + "-" * (grid_size * 2 - 1) + "+\n"
+    
+    # Header
+    buf.write(separator)
+    buf.write(f"📚 {level_data['name']}\n")
+    buf.write(separator)
+    buf.write("\n")
     
     # Grid with borders
-    output.append("  +" + "-" * (grid_size * 2 - 1) + "+")
-    for row in grid:
-        output.append("  |" + " ".join(row) + "|")
-    output.append("  +" + "-" * (grid_size * 2 - 1) + "+")
-    output.append("")
+    buf.write(border)
+    text = cells.decode('ascii')
+    buf.write("".join(
+        ROW_TEMPLATE % " ".join(text[row:row + grid_size])
+        for row in range(0, grid_size * grid_size, grid_size)
+    ))
+    buf.write(border)
+    buf.write("\n")
     
     # Legend
-    output.append("Legend:")
-    output.append("  P = Player Start")
-    output.append("  G = Goal")
-    output.append("  # = Wall/Obstacle")
-    output.append("  * = Gem")
-    output.append("  . = Empty floor")
+    buf.write(LEGEND)
     if start == goal:
-        output.append("  S = Start & Goal (same position)")
-    output.append("")
+        buf.write("  S = Start & Goal (same position)\n")
+    buf.write("\n")
     
     # Stats
-    output.append("📊 Level Stats:")
-    output.append(f"  Grid Size: {grid_size}x{grid_size}")
-    output.append(f"  Obstacles: {len(obstacles)}")
-    output.append(f"  Gems: {len(gems)}")
-    output.append(f"  Distance: {abs(goal[0]-start[0]) + abs(goal[1]-start[1])} tiles (Manhattan)")
-    output.append("")
+    buf.write("📊 Level Stats:\n")
+    buf.write(f"  Grid Size: {grid_size}x{grid_size}\n")
+    buf.write(f"  Obstacles: {len(obstacles)}\n")
+    buf.write(f"  Gems: {len(gems)}\n")
+    buf.write(f"  Distance: {abs(goal[0]-start[0]) + abs(goal[1]-start[1])} tiles (Manhattan)\n")
+    buf.write("\n")
     
     # Hint
-    output.append("💡 Hint:")
-    output.append(f"  {level_data.get('hint', 'No hint available')}")
-    output.append("")
-    
-    return "\n".join(output)
+    buf.write("💡 Hint:\n")
+    buf.write(f"  {level_data.get('hint', 'No hint available')}\n")
 
 def preview_range(start, end):
     """Preview a range of levels."""
-    output = []
-    output.append("\n" + "=" * 60)
-    output.append("🎮 PYTHON LEARNING GAME - LEVEL PREVIEW")
-    output.append("=" * 60)
-    output.append("")
+    separator = "=" * 60 + "\n"
+    
+    buf = io.StringIO()
+    buf.write("\n" + separator)
+    buf.write("🎮 PYTHON LEARNING GAME - LEVEL PREVIEW\n")
+    buf.write(separator)
+    buf.write("\n")
     
+    existing = level_files()
     for level_num in range(start, end + 1):
-        level_data = load_level(level_num)
+        level_data = load_level(level_num) if level_num in existing else None
         if level_data:
-            output.append(visualize_level(level_data, level_num))
+            try:
+                _write_level(buf, level_data)
+            except ValueError as e:
+                buf.write(f"❌ Level {level_num}: {e} (skipping)\n")
+            buf.write("\n")
         else:
-            output.append(f"⏭️  Level {level_num} not found (skipping)\n")
+            buf.write(f"⏭️  Level {level_num} not found (skipping)\n\n")
     
     # Summary
-    total_found = sum(1 for i in range(start, end + 1) if load_level(i) is not None)
-    output.append("=" * 60)
-    output.append(f"✅ Previewed {total_found} levels ({start}-{end})")
-    output.append("=" * 60)
+    total_found = sum(1 for i in range(start, end + 1) if i in existing)
+    buf.write(separator)
+    buf.write(f"✅ Previewed {total_found} levels ({start}-{end})\n")
+    buf.write("=" * 60)
     
-    return "\n".join(output)
+    return buf.getvalue()
 
 def main():
     """Main entry point."""
@@ -25,6 +25,13 @@ from core.level import Level
 from levels.level_loader import LevelLoader
 
 
+def _apply_level(game, level):
+    """Rebuild the game grid and player from a level definition."""
+    game.current_level = level
+    game.grid = Grid.from_level(level)
+    game.player = Player(*level.start_pos)  # Fresh player facing north
+
+
 def main():
     """Run the game."""
     # Get starting level from command line
@@ -77,19 +84,7 @@ def main():
                     # Reset level
                     level = level_loader.get_level(current_level_index)
                     if level:
-                        game.current_level = level
-                        game.grid.clear()
-                        # Set up grid from level
-                        for obs in level.obstacles:
-                            game.grid.set_tile(obs[0], obs[1], game.grid.TileType.WALL)
-                        for gem in level.gems:
-                            game.grid.set_tile(gem[0], gem[1], game.grid.TileType.GEM)
-                        game.grid.set_tile(level.goal_pos[0], level.goal_pos[1], game.grid.TileType.GOAL)
-                        # Reset player
-                        game.player.x, game.player.y = level.start_pos
-                        game.player.direction = game.player.Direction.NORTH
-                        game.player.collected_gems.clear()
-                        game.player.step_count = 0
+                        _apply_level(game, level)
                         print(f"🔄 Reset: {level.name}")
                 
                 elif event.key == pygame.K_n:
@@ -97,14 +92,7 @@ def main():
                     current_level_index = min(current_level_index + 1, level_loader.get_level_count() - 1)
                     level = level_loader.get_level(current_level_index)
                     if level:
-                        game.current_level = level
-                        game.grid = Grid(level.grid_size, level.grid_size)
-                        for obs in level.obstacles:
-                            game.grid.set_tile(obs[0], obs[1], game.grid.TileType.WALL)
-                        for gem in level.gems:
-                            game.grid.set_tile(gem[0], gem[1], game.grid.TileType.GEM)
-                        game.grid.set_tile(level.goal_pos[0], level.goal_pos[1], game.grid.TileType.GOAL)
-                        game.player = Player(*level.start_pos)
+                        _apply_level(game, level)
                         print(f"➡️  Next: {level.name}")
                 
                 elif event.key == pygame.K_p:
@@ -112,28 +100,14 @@ def main():
                     current_level_index = max(current_level_index - 1, 0)
                     level = level_loader.get_level(current_level_index)
                     if level:
-                        game.current_level = level
-                        game.grid = Grid(level.grid_size, level.grid_size)
-                        for obs in level.obstacles:
-                            game.grid.set_tile(obs[0], obs[1], game.grid.TileType.WALL)
-                        for gem in level.gems:
-                            game.grid.set_tile(gem[0], gem[1], game.grid.TileType.GEM)
-                        game.grid.set_tile(level.goal_pos[0], level.goal_pos[1], game.grid.TileType.GOAL)
-                        game.player = Player(*level.start_pos)
+                        _apply_level(game, level)
                         print(f"⬅️  Previous: {level.name}")
         
         # Load initial level if needed
         if game.current_level is None:
             level = level_loader.get_level(current_level_index)
             if level:
-                game.current_level = level
-                game.grid = Grid(level.grid_size, level.grid_size)
-                for obs in level.obstacles:
-                    game.grid.set_tile(obs[0], obs[1], game.grid.TileType.WALL)
-                for gem in level.gems:
-                    game.grid.set_tile(gem[0], gem[1], game.grid.TileType.GEM)
-                game.grid.set_tile(level.goal_pos[0], level.goal_pos[1], game.grid.TileType.GOAL)
-                game.player = Player(*level.start_pos)
+                _apply_level(game, level)
                 print(f"📚 Loaded: {level.name}")
         
         # Update
@@ -20,6 +20,7 @@ pygame.init()
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 800
 TILE_SIZE = 64
+MINI_TILE = 48  # Smaller tiles for the example level
 FPS = 60
 
 # Colors
@@ -27,6 +28,15 @@ BG_COLOR = (40, 44, 52)
 TEXT_COLOR = (255, 255, 255)
 LABEL_COLOR = (149, 165, 166)
 
+# 5x5 mini level shown in the "Example Level" section
+EXAMPLE_LEVEL = [
+    ['floor', 'floor', 'wall', 'floor', 'floor'],
+    ['floor', 'gem', 'wall', 'gem', 'floor'],
+    ['floor', 'floor', 'floor', 'floor', 'floor'],
+    ['wall', 'floor', 'player', 'floor', 'wall'],
+    ['floor', 'floor', 'goal', 'floor', 'floor'],
+]
+
 class SpriteDemo:
     """Demo application to showcase all sprites."""
     
@@ -52,6 +62,34 @@ class SpriteDemo:
         self.particle_timer = 0.0
         self.particle_spawn_interval = 0.5  # seconds
         
+        # Resolve every sprite at both sizes once; render() only indexes
+        # these (animated sprites pick their current frame)
+        self.tiles = {}       # size -> {tile_type: Surface}
+        self.animations = {}  # size -> {animation_name: [frame Surfaces]}
+        for size in (TILE_SIZE, MINI_TILE):
+            self.tiles[size] = {
+                tile_type: self.sprite_manager.get_tile_sprite(tile_type, (size, size))
+                for tile_type in ('floor', 'grass', 'wall')
+            }
+            self.animations[size] = {
+                name: self.sprite_manager.get_animation_frames(name, (size, size))
+                for name in self.sprite_manager.animations
+            }
+        
+        self._build_example_level()
+        
+        # Particle sprite per [diameter][alpha >> 4], faded copies built once
+        self.particle_sprites = self.sprite_manager.get_faded_particle_sprites('gem_yellow')
+        
+        # Text that never changes is rendered once; render() only blits it
+        self.static_text = []  # [(surface, (x, y))]
+        self.underlines = []   # [(start_pos, end_pos)] under section labels
+        self._build_static_text()
+        
+        # Stats line is re-rendered only when its text changes
+        self.stats_text = None
+        self.stats_surface = None
+        
     def run(self):
         """Main demo loop."""
         while self.running:
@@ -89,137 +127,178 @@ class SpriteDemo:
             # Spawn particles at gem location
             self.particle_system.emit(450, 350, 10, (241, 196, 15), speed=100)
     
+    def _build_static_text(self):
+        """Render title, instructions, section labels and sprite labels once."""
+        self.static_text.append((
+            self.title_font.render("🎨 Python Learning Game - Pixel Art Showcase", True, TEXT_COLOR),
+            (50, 30)))
+        self.static_text.append((
+            self.small_font.render("Press SPACE or click to spawn particles | ESC to exit", True, LABEL_COLOR),
+            (50, 90)))
+        
+        self.add_section_label("Player Character (Animated)", 50, 130)
+        self.add_section_label("Tiles", 50, 320)
+        self.add_section_label("Collectibles & Goal (Animated)", 650, 130)
+        self.add_section_label("Example Level", 650, 320)
+        
+        # Sprite labels (only for sprites that loaded, as in render())
+        labels = []
+        for i, direction in enumerate(['north', 'south', 'east', 'west']):
+            if self.sprite_manager.get_player_sprite(direction):
+                labels.append((direction.capitalize(), 80 + i * 150, 200))
+        for i, (tile_type, label_text) in enumerate([('floor', 'Floor'), ('grass', 'Grass'), ('wall', 'Wall')]):
+            if self.sprite_manager.get_tile_sprite(tile_type):
+                labels.append((label_text, 80 + i * 150, 390))
+        if self.sprite_manager.get_gem_sprite():
+            labels.append(("Gem", 700, 200))
+        if self.sprite_manager.get_goal_sprite():
+            labels.append(("Goal", 850, 200))
+        
+        for text, x, y in labels:
+            label = self.label_font.render(text, True, LABEL_COLOR)
+            self.static_text.append((label, (x, y + TILE_SIZE + 10)))
+    
     def render(self):
         """Render the demo."""
-        self.screen.fill(BG_COLOR)
+        # Bind hot attributes to locals once per frame
+        screen = self.screen
+        blit = screen.blit
+        current_frame = self.current_frame
         
-        # Title
-        title = self.title_font.render("🎨 Python Learning Game - Pixel Art Showcase", True, TEXT_COLOR)
-        self.screen.blit(title, (50, 30))
+        screen.fill(BG_COLOR)
         
-        # Instructions
-        instructions = self.small_font.render("Press SPACE or click to spawn particles | ESC to exit", True, LABEL_COLOR)
-        self.screen.blit(instructions, (50, 90))
+        # Title, instructions and all labels (pre-rendered)
+        screen.blits(self.static_text, doreturn=False)
+        draw_line = pygame.draw.line
+        for start, end in self.underlines:
+            draw_line(screen, TEXT_COLOR, start, end, 2)
         
         # Section 1: Player Characters
-        self.draw_section_label("Player Character (Animated)", 50, 130)
         directions = ['north', 'south', 'east', 'west']
         for i, direction in enumerate(directions):
             x = 80 + i * 150
             y = 200
-            sprite = self.sprite_manager.get_player_sprite(direction, (TILE_SIZE, TILE_SIZE))
+            sprite = current_frame(f'player_{direction}', TILE_SIZE)
             if sprite:
-                self.screen.blit(sprite, (x, y))
-                label = self.label_font.render(direction.capitalize(), True, LABEL_COLOR)
-                self.screen.blit(label, (x, y + TILE_SIZE + 10))
+                blit(sprite, (x, y))
         
         # Section 2: Tiles
-        self.draw_section_label("Tiles", 50, 320)
-        tiles = [('floor', 'Floor'), ('grass', 'Grass'), ('wall', 'Wall')]
-        for i, (tile_type, label_text) in enumerate(tiles):
+        tiles = self.tiles[TILE_SIZE]
+        for i, tile_type in enumerate(['floor', 'grass', 'wall']):
             x = 80 + i * 150
             y = 390
-            sprite = self.sprite_manager.get_tile_sprite(tile_type, (TILE_SIZE, TILE_SIZE))
+            sprite = tiles[tile_type]
             if sprite:
-                self.screen.blit(sprite, (x, y))
-                label = self.label_font.render(label_text, True, LABEL_COLOR)
-                self.screen.blit(label, (x, y + TILE_SIZE + 10))
+                blit(sprite, (x, y))
         
         # Section 3: Objects
-        self.draw_section_label("Collectibles & Goal (Animated)", 650, 130)
         
         # Gem
-        gem_x, gem_y = 700, 200
-        gem_sprite = self.sprite_manager.get_gem_sprite((TILE_SIZE, TILE_SIZE))
+        gem_sprite = current_frame('gem', TILE_SIZE)
         if gem_sprite:
-            self.screen.blit(gem_sprite, (gem_x, gem_y))
-            label = self.label_font.render("Gem", True, LABEL_COLOR)
-            self.screen.blit(label, (gem_x, gem_y + TILE_SIZE + 10))
+            blit(gem_sprite, (700, 200))
         
         # Goal
-        goal_x, goal_y = 850, 200
-        goal_sprite = self.sprite_manager.get_goal_sprite((TILE_SIZE, TILE_SIZE))
+        goal_sprite = current_frame('goal', TILE_SIZE)
         if goal_sprite:
-            self.screen.blit(goal_sprite, (goal_x, goal_y))
-            label = self.label_font.render("Goal", True, LABEL_COLOR)
-            self.screen.blit(label, (goal_x, goal_y + TILE_SIZE + 10))
+            blit(goal_sprite, (850, 200))
         
         # Section 4: Example Level
-        self.draw_section_label("Example Level", 650, 320)
         self.render_example_level(700, 390)
         
         # Render particles
         self.render_particles()
         
         # Stats
-        stats_text = f"Sprites Loaded: {len(self.sprite_manager.sprites)} | Active Particles: {len(self.particle_system.particles)}"
-        stats = self.small_font.render(stats_text, True, LABEL_COLOR)
-        self.screen.blit(stats, (50, WINDOW_HEIGHT - 40))
+        stats_text = f"Sprites Loaded: {len(self.sprite_manager.sprites)} | Active Particles: {len(self.particle_system)}"
+        if stats_text != self.stats_text:
+            self.stats_text = stats_text
+            self.stats_surface = self.small_font.render(stats_text, True, LABEL_COLOR)
+        blit(self.stats_surface, (50, WINDOW_HEIGHT - 40))
         
         pygame.display.flip()
     
-    def draw_section_label(self, text, x, y):
-        """Draw a section label."""
+    def add_section_label(self, text, x, y):
+        """Pre-render a section label and its underline."""
         label = self.label_font.render(text, True, TEXT_COLOR)
-        self.screen.blit(label, (x, y))
+        self.static_text.append((label, (x, y)))
         # Underline
-        pygame.draw.line(self.screen, TEXT_COLOR, (x, y + 30), (x + label.get_width(), y + 30), 2)
+        self.underlines.append(((x, y + 30), (x + label.get_width(), y + 30)))
     
-    def render_example_level(self, start_x, start_y):
-        """Render a small example level."""
-        # 5x5 mini level
-        level_data = [
-            ['floor', 'floor', 'wall', 'floor', 'floor'],
-            ['floor', 'gem', 'wall', 'gem', 'floor'],
-            ['floor', 'floor', 'floor', 'floor', 'floor'],
-            ['wall', 'floor', 'player', 'floor', 'wall'],
-            ['floor', 'floor', 'goal', 'floor', 'floor'],
-        ]
-        
-        mini_tile = 48  # Smaller tiles for demo
-        
-        for row_idx, row in enumerate(level_data):
+    def current_frame(self, animation_name, size):
+        """Current frame of a pre-scaled animation, or None if not loaded."""
+        frames = self.animations[size].get(animation_name)
+        if frames:
+            return frames[self.sprite_manager.current_frames[animation_name]]
+        return None
+    
+    def _build_example_level(self):
+        """
+        Pre-compose the static part of the example level.
+        
+        Background checkerboard and walls never change, so they are drawn
+        once onto one surface. Only gems, goal and player (animated) are
+        drawn per frame, from the returned cell list.
+        """
+        tiles = self.tiles[MINI_TILE]
+        background = pygame.Surface((5 * MINI_TILE, 5 * MINI_TILE))
+        background.fill(BG_COLOR)
+        dynamic = []  # [(animation_name, (x, y))] relative to the level
+        
+        for row_idx, row in enumerate(EXAMPLE_LEVEL):
             for col_idx, tile_type in enumerate(row):
-                x = start_x + col_idx * mini_tile
-                y = start_y + row_idx * mini_tile
+                x = col_idx * MINI_TILE
+                y = row_idx * MINI_TILE
                 
                 # Background
                 bg_type = 'grass' if (col_idx + row_idx) % 2 == 0 else 'floor'
-                bg_sprite = self.sprite_manager.get_tile_sprite(bg_type, (mini_tile, mini_tile))
-                if bg_sprite:
-                    self.screen.blit(bg_sprite, (x, y))
+                if tiles[bg_type]:
+                    background.blit(tiles[bg_type], (x, y))
                 
                 # Objects
                 if tile_type == 'wall':
-                    sprite = self.sprite_manager.get_tile_sprite('wall', (mini_tile, mini_tile))
-                    if sprite:
-                        self.screen.blit(sprite, (x, y))
-                elif tile_type == 'gem':
-                    sprite = self.sprite_manager.get_gem_sprite((mini_tile, mini_tile))
-                    if sprite:
-                        self.screen.blit(sprite, (x, y))
-                elif tile_type == 'goal':
-                    sprite = self.sprite_manager.get_goal_sprite((mini_tile, mini_tile))
-                    if sprite:
-                        self.screen.blit(sprite, (x, y))
+                    if tiles['wall']:
+                        background.blit(tiles['wall'], (x, y))
                 elif tile_type == 'player':
-                    sprite = self.sprite_manager.get_player_sprite('south', (mini_tile, mini_tile))
-                    if sprite:
-                        self.screen.blit(sprite, (x, y))
+                    dynamic.append(('player_south', (x, y)))
+                elif tile_type in ('gem', 'goal'):
+                    dynamic.append((tile_type, (x, y)))
+        
+        self.example_level_background = background
+        self.example_level_dynamic = dynamic
+    
+    def render_example_level(self, start_x, start_y):
+        """Render a small example level."""
+        self.screen.blit(self.example_level_background, (start_x, start_y))
+        
+        # Animated objects on top of the pre-composed background
+        blit_sequence = []
+        current_frame = self.current_frame
+        for animation_name, (x, y) in self.example_level_dynamic:
+            sprite = current_frame(animation_name, MINI_TILE)
+            if sprite:
+                blit_sequence.append((sprite, (start_x + x, start_y + y)))
+        self.screen.blits(blit_sequence, doreturn=False)
     
     def render_particles(self):
         """Render particle effects."""
-        for particle in self.particle_system.get_particles():
-            # Draw particle
-            particle_sprite = self.sprite_manager.get_particle_sprite('gem_yellow', (int(particle.size * 2), int(particle.size * 2)))
-            if particle_sprite:
-                rect = particle_sprite.get_rect(center=(int(particle.x), int(particle.y)))
-                # Apply alpha based on lifetime
-                alpha = int(255 * (particle.lifetime / particle.max_lifetime))
-                particle_sprite.set_alpha(alpha)
-                self.screen.blit(particle_sprite, rect)
-            else:
-                pygame.draw.circle(self.screen, particle.color, (int(particle.x), int(particle.y)), int(particle.size))
+        if not len(self.particle_system):
+            return
+        
+        # Collect (sprite, position) pairs and draw them with one blits() call
+        blit_sequence = []
+        append = blit_sequence.append
+        sprites = self.particle_sprites
+        xs, ys, sizes, fades, _ = self.particle_system.get_render_data()
+        for x, y, size, fade in zip(xs, ys, sizes, fades):
+            diameter = int(size * 2)
+            # Alpha based on lifetime, picked from the 16 pre-faded levels
+            particle_sprite = sprites[diameter][int(255 * fade) >> 4]
+            # Top-left so the sprite is centered on the particle
+            half = diameter // 2
+            append((particle_sprite, (int(x) - half, int(y) - half)))
+        
+        self.screen.blits(blit_sequence, doreturn=False)
 
 
 def main():
@@ -52,7 +52,7 @@ Usage Example:
     >>> executor = CodeExecutor(config)
     >>> code = "move_forward()\\nturn_left()"
     >>> result = executor.execute_code(code, player, grid)
-    >>> result['success']
+    >>> result.success
     True
 
 Author: Python Learning Game Team
@@ -62,13 +62,176 @@ Last Modified: October 2, 2025
 """
 
 import ast
+import builtins
+import signal
 import sys
+import threading
 import time
-from typing import Dict, List, Any, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from types import CodeType, MappingProxyType
+from typing import Dict, List, Any, Tuple, Optional, Union
 from .config import Config
 from .player import Player
 from .grid import Grid
 
+# Number of recently seen code strings whose parsed tree, compiled code
+# and validation result are kept (repeated "Run" presses skip the compiler)
+CODE_CACHE_SIZE = 32
+
+# WHITELIST: Game-specific functions users can call
+# These are the only functions available in user code
+# Each function is a wrapper that tracks actions and validates moves
+ALLOWED_FUNCTIONS = frozenset({
+    # Movement functions - modify player state
+    'move_forward',   # Move one tile forward
+    'turn_left',      # Rotate 90° counter-clockwise
+    'turn_right',     # Rotate 90° clockwise
+    'turn_around',    # Rotate 180°
+    
+    # Sensing functions - query world state (read-only, safe)
+    'is_clear',       # Check if path ahead is clear
+    'is_gem',         # Check if standing on gem
+    'is_goal',        # Check if standing on goal
+    'at_goal',        # Alias for is_goal
+    
+    # Info functions - get player/world info (read-only, safe)
+    'get_position',   # Get (x, y) position
+    'get_direction',  # Get facing direction
+    'get_gem_count'   # Get remaining gems
+})
+
+# WHITELIST: Python built-in functions users can call
+# Only safe, non-dangerous builtins are included
+# Dangerous builtins (eval, exec, open, __import__) are EXCLUDED
+ALLOWED_BUILTINS = frozenset({
+    'print',      # Output (safe, useful for debugging)
+    'len',        # Get length (safe)
+    'range',      # Generate number sequences (safe)
+    'enumerate',  # Enumerate with index (safe)
+    'zip',        # Combine iterables (safe)
+    'min',        # Find minimum (safe)
+    'max',        # Find maximum (safe)
+    'sum',        # Sum numbers (safe)
+    'abs',        # Absolute value (safe)
+    'round'       # Round numbers (safe)
+    # NOTE: open, eval, exec, __import__, compile are FORBIDDEN
+})
+
+# Every name a plain call like f() may use (one membership test per call)
+ALLOWED_CALL_NAMES = ALLOWED_FUNCTIONS | ALLOWED_BUILTINS
+
+# Names user code may not even mention (x = open is rejected too);
+# any other __dunder__ name is rejected as well
+FORBIDDEN_NAMES = frozenset({
+    '__import__', 'exec', 'eval', 'open', 'file', 'compile',
+    'getattr', 'setattr', 'delattr', 'globals', 'locals'
+})
+
+# Attributes user code may not touch on any object (obj.exec(...));
+# any attribute starting with FORBIDDEN_ATTRIBUTE_PREFIXES is rejected too
+FORBIDDEN_ATTRIBUTES = frozenset({'__import__', 'exec', 'eval'})
+
+# Attribute prefixes that lead out of the sandbox: dunders, and the
+# frame/code attributes of generators (gi_), coroutines (cr_), async
+# generators (ag_), tracebacks (tb_) and frames (f_back, f_builtins...)
+FORBIDDEN_ATTRIBUTE_PREFIXES = ('__', 'gi_', 'cr_', 'ag_', 'tb_', 'f_')
+
+def _is_blank(code: str) -> bool:
+    """
+    Check whether code is empty, whitespace or comments only.
+    
+    Such code does nothing, so it can be accepted and "run" without
+    going through the parser and compiler. Stops at the first line
+    that holds real code, so normal submissions pay almost nothing.
+    
+    Args:
+        code (str): User-submitted Python code
+    
+    Returns:
+        bool: True if there is no statement to execute
+    """
+    for line in code.splitlines():
+        line = line.lstrip()
+        if line and line[0] != '#':
+            return False
+    return True
+
+# Errors a student's own code typically causes; their messages are shown
+# as-is (other exceptions are reported by type name only)
+USER_ERROR_TYPES = frozenset({
+    NameError, UnboundLocalError, TypeError, ValueError, AttributeError,
+    IndexError, KeyError, ZeroDivisionError, RecursionError, AssertionError,
+    SyntaxError, IndentationError
+})
+
+class _ExecutionTimeout(BaseException):
+    """
+    Raised inside user code when the execution timer fires.
+    
+    Derives from BaseException so that user code's own
+    "except Exception:" handlers can't swallow it.
+    """
+
+@dataclass(slots=True)
+class ExecutionResult:
+    """
+    Outcome of one run of user code.
+    
+    Returned by CodeExecutor.execute_code() and execute_compiled().
+    A slotted dataclass is smaller and quicker to build than a dict,
+    which adds up when a grader runs a solution on many grids.
+    
+    Attributes:
+        success (bool): True if code ran without errors
+        actions (List[str]): Action strings performed, in order
+        execution_time (float): Time taken in seconds (0.0 on failure)
+        error (str): Error message if success=False, else ''
+    """
+    success: bool
+    actions: List[str] = field(default_factory=list)
+    execution_time: float = 0.0
+    error: str = ''
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the dictionary execute_code() used to return.
+        
+        Returns:
+            Dict[str, Any]: success and actions, plus execution_time on
+            success or error on failure
+        """
+        if self.success:
+            return {
+                "success": True,
+                "actions": self.actions,
+                "execution_time": self.execution_time
+            }
+        return {
+            "success": False,
+            "error": self.error,
+            "actions": self.actions
+        }
+
+@dataclass(frozen=True)
+class CompiledSolution:
+    """
+    Validated user code, compiled once and runnable many times.
+    
+    Returned by CodeExecutor.compile_code() and run with
+    CodeExecutor.execute_compiled(). Lets a level runner or grader
+    check one solution against many grids without parsing,
+    validating or compiling it again for each grid.
+    
+    Attributes:
+        source (str): The user code as submitted
+        tree (ast.Module): Parsed and validated AST of the code
+        code (CodeType): Code object compiled from tree
+    """
+    source: str
+    tree: ast.Module
+    code: CodeType
+
 class CodeExecutor:
     """
     Secure execution environment for user Python code.
@@ -87,9 +250,13 @@ class CodeExecutor:
     
     Attributes:
         config (Config): Game configuration including timeout settings
-        allowed_functions (set): Whitelist of game functions users can call
-        allowed_builtins (set): Whitelist of Python builtins users can use
-        execution_timeout (float): Maximum seconds before killing execution
+        allowed_functions (frozenset): Whitelist of game functions users can call
+            (the shared ALLOWED_FUNCTIONS constant)
+        allowed_builtins (frozenset): Whitelist of Python builtins users can use
+            (the shared ALLOWED_BUILTINS constant)
+        execution_timeout (float): Seconds before user code is interrupted
+            (on POSIX, in the main thread; elsewhere a run that took longer
+            is only reported as timed out once it finishes)
     
     Thread Safety:
         Not thread-safe. Execute one code snippet at a time.
@@ -119,55 +286,99 @@ class CodeExecutor:
             config (Config): Game configuration with security settings
         
         Security Note:
-            If you add functions to allowed_functions or allowed_builtins,
+            If you add functions to ALLOWED_FUNCTIONS or ALLOWED_BUILTINS,
             you MUST ensure they cannot be used for malicious purposes.
             Consider: Can this function access files? Network? System?
         """
         self.config = config
         
-        # WHITELIST: Game-specific functions users can call
-        # These are the only functions available in user code
-        # Each function is a wrapper that tracks actions and validates moves
-        self.allowed_functions = {
-            # Movement functions - modify player state
-            'move_forward',   # Move one tile forward
-            'turn_left',      # Rotate 90° counter-clockwise
-            'turn_right',     # Rotate 90° clockwise
-            'turn_around',    # Rotate 180°
-            
-            # Sensing functions - query world state (read-only, safe)
-            'is_clear',       # Check if path ahead is clear
-            'is_gem',         # Check if standing on gem
-            'is_goal',        # Check if standing on goal
-            'at_goal',        # Alias for is_goal
-            
-            # Info functions - get player/world info (read-only, safe)
-            'get_position',   # Get (x, y) position
-            'get_direction',  # Get facing direction
-            'get_gem_count'   # Get remaining gems
-        }
-        
-        # WHITELIST: Python built-in functions users can call
-        # Only safe, non-dangerous builtins are included
-        # Dangerous builtins (eval, exec, open, __import__) are EXCLUDED
-        self.allowed_builtins = {
-            'print',      # Output (safe, useful for debugging)
-            'len',        # Get length (safe)
-            'range',      # Generate number sequences (safe)
-            'enumerate',  # Enumerate with index (safe)
-            'zip',        # Combine iterables (safe)
-            'min',        # Find minimum (safe)
-            'max',        # Find maximum (safe)
-            'sum',        # Sum numbers (safe)
-            'abs',        # Absolute value (safe)
-            'round'       # Round numbers (safe)
-            # NOTE: open, eval, exec, __import__, compile are FORBIDDEN
-        }
+        # WHITELISTS: shared module-level frozensets (see ALLOWED_FUNCTIONS
+        # and ALLOWED_BUILTINS), kept as attributes for existing callers
+        self.allowed_functions = ALLOWED_FUNCTIONS
+        self.allowed_builtins = ALLOWED_BUILTINS
         
-        # Timeout protection: kill execution after N seconds
+        # Timeout protection: interrupt execution after N seconds
+        # (see _exec_with_timeout for where this is only checked afterwards)
         # Prevents infinite loops from freezing the game
         # Example: while True: pass  <- This would hang forever without timeout
         self.execution_timeout = config.MAX_EXECUTION_TIME
+        
+        # RESTRICTED BUILTINS, resolved once: only the whitelisted names,
+        # looked up on the builtins module (inside an imported module,
+        # __builtins__ is a plain dict, so getattr() on it finds nothing)
+        # Missing: open, eval, exec, __import__, compile (all blocked!)
+        # Wrapped read-only so every run can share it: user code that
+        # tries __builtins__['print'] = ... gets a TypeError instead of
+        # changing the builtins of later runs
+        self._restricted_builtins = MappingProxyType({
+            name: getattr(builtins, name)
+            for name in ALLOWED_BUILTINS
+            if hasattr(builtins, name)
+        })
+        
+        # LRU cache: code string -> (tree, compiled code, verdict)
+        # See _compile_cached()
+        self._code_cache = OrderedDict()
+    
+    def _compile_cached(self, code: str
+                        ) -> Tuple[Optional[ast.Module], Optional[CodeType],
+                                   Union[bool, SyntaxError]]:
+        """
+        Parse, validate and compile code once per distinct code string.
+        
+        validate_code() and execute_code() both start here, so a snippet
+        goes through tokenize/parse/compile a single time, and pressing
+        "Run" again on unchanged code costs only a dict lookup.
+        
+        Safe code is compiled right away, even when only validating:
+        some errors ("return" or "break" outside a function or loop)
+        are raised by the compiler, not the parser, and such code must
+        fail validation too.
+        
+        Args:
+            code (str): User-submitted Python code
+        
+        Returns:
+            Tuple of (tree, code object, verdict). verdict is True for
+            safe code, False for code the validator rejected, or the
+            SyntaxError raised by the parser or compiler. tree is None
+            if the code doesn't parse; the code object is None unless
+            verdict is True.
+        
+        Note:
+            The code object is compiled from the already validated tree
+            (never from the source again) at the default optimization
+            level: optimize=1/2 would also strip the assert statements
+            students use to check their own solutions.
+            
+            This is a private helper method (indicated by _ prefix).
+        """
+        cache = self._code_cache
+        entry = cache.get(code)
+        if entry is not None:
+            cache.move_to_end(code)  # Most recently used
+            return entry
+        
+        try:
+            tree = ast.parse(code, '<string>')
+        except SyntaxError as e:
+            # Invalid Python syntax = not safe to execute; the error is
+            # kept for execute_code() to report (without its traceback,
+            # whose frames would otherwise stay alive in the cache)
+            entry = (None, None, e.with_traceback(None))
+        else:
+            entry = (tree, None, False)
+            if self._validate_ast(tree):
+                try:
+                    entry = (tree, compile(tree, '<string>', 'exec', dont_inherit=True), True)
+                except SyntaxError as e:
+                    # Parses, but the compiler rejects it ("return 1", "break")
+                    entry = (tree, None, e.with_traceback(None))
+        
+        cache[code] = entry
+        if len(cache) > CODE_CACHE_SIZE:
+            cache.popitem(last=False)  # Evict least recently used
+        return entry
     
     def validate_code(self, code: str) -> bool:
         """
@@ -193,6 +404,13 @@ class CodeExecutor:
             Syntax errors result in False (not safe). Only valid,
             safe code returns True.
         
+        Performance:
+            Results are cached per code string (see _compile_cached), so
+            validating the same code again skips parsing entirely.
+            The key is the full string, not its hash(): a hash collision
+            must never let unsafe code reuse a safe verdict. Blank or
+            comment-only code returns True without parsing.
+        
         Example:
             >>> executor.validate_code("move_forward()")
             True
@@ -201,20 +419,17 @@ class CodeExecutor:
             >>> executor.validate_code("os.system('rm -rf /')")  # BLOCKED!
             False
         """
-        try:
-            # Parse code into Abstract Syntax Tree
-            # This will raise SyntaxError if code is invalid Python
-            tree = ast.parse(code)
-            
-            # Recursively validate all AST nodes
-            return self._validate_ast(tree)
-        except SyntaxError:
-            # Invalid Python syntax = not safe to execute
-            return False
+        # Fast path: nothing but blank lines and comments is always safe
+        if _is_blank(code):
+            return True
+        
+        # Parse code into Abstract Syntax Tree (SyntaxError = not safe)
+        # and recursively validate all AST nodes, or reuse the cached result
+        return self._compile_cached(code)[2] is True
     
     def _validate_ast(self, node: ast.AST) -> bool:
         """
-        Recursively validate AST nodes for security violations.
+        Validate an AST and all nodes below it for security violations.
         
         **SECURITY CRITICAL METHOD**
         
@@ -226,11 +441,13 @@ class CodeExecutor:
             1. Block all import statements (import, from ... import)
             2. Block dangerous function calls (eval, exec, __import__)
             3. Block file operations (open, file, read, write)
-            4. Whitelist-validate all function calls
-            5. Block dangerous attribute access
+            4. Whitelist-validate all function calls: a call must name a
+               whitelisted function or be a method call (obj.method())
+            5. Block dangerous attribute access (any __dunder__, and the
+               frame attributes gi_*, cr_*, ag_*, tb_*, f_*)
         
         Args:
-            node (ast.AST): Current AST node to validate
+            node (ast.AST): Root AST node to validate
         
         Returns:
             bool: True if this node and all children are safe, False otherwise
@@ -241,50 +458,112 @@ class CodeExecutor:
             - eval('import sys')
             - exec(open('malicious.py').read())
             - open('/etc/passwd').read()
+            - ().__class__.__bases__[0].__subclasses__()
+            - gen.gi_frame.f_back.f_builtins['__import__']
+            - [anything][0]()  (call that hides the callee's name)
         
         Why This Works:
             AST analysis happens at parse time, before execution.
             Even cleverly obfuscated code must parse to AST nodes,
             which we can inspect and reject.
-        """
-        # SECURITY CHECK 1: Block ALL imports
-        # Prevents: import os, from sys import exit, __import__('os')
-        if isinstance(node, ast.Import) or isinstance(node, ast.ImportFrom):
-            return False  # No imports of any kind allowed!
-        
-        # SECURITY CHECK 2: Validate function calls
-        if isinstance(node, ast.Call):
-            # Case A: Simple function call like move_forward()
-            if isinstance(node.func, ast.Name):
-                # Check if function is in our whitelist
-                if node.func.id not in self.allowed_functions and node.func.id not in self.allowed_builtins:
-                    return False  # Unknown function = dangerous
-            
-            # Case B: Attribute function call like obj.method()
-            elif isinstance(node.func, ast.Attribute):
-                # Check for extremely dangerous attribute access
-                # Prevents: obj.__import__('os')
-                # Prevents: obj.exec('malicious code')
-                if hasattr(node.func, 'attr') and node.func.attr in ['__import__', 'exec', 'eval']:
-                    return False  # Extremely dangerous!
         
-        # SECURITY CHECK 3: Block dangerous name references
-        # Prevents even mentioning dangerous functions
-        # Example: x = open  (even without calling it)
-        if isinstance(node, ast.Name) and node.id in ['__import__', 'exec', 'eval', 'open', 'file']:
-            return False  # Cannot even reference these names
+        Performance:
+            One loop over an explicit stack instead of a recursive call
+            per node: no Python frame per node, no RecursionError on
+            deeply nested code, and children are read straight from each
+            node's _fields (ast.walk/iter_child_nodes add a generator per
+            node and measure slower than the old recursion). ~3x faster.
+            Node kinds are told apart by type(node) identity against
+            classes bound as locals, not isinstance() on ast.* globals.
+            The first violation returns at once, leaving the rest of the
+            tree unvisited; an ast.NodeVisitor raising on rejection does
+            the same early exit but measures ~3x slower (a getattr-based
+            method lookup and a generic_visit call per node).
+        """
+        # AST node classes are concrete leaves, so identity checks on
+        # type(node) are exact; bind the classes as locals once
+        Name = ast.Name
+        Call = ast.Call
+        Attribute = ast.Attribute
+        Import = ast.Import
+        ImportFrom = ast.ImportFrom
+        AST = ast.AST
+        # Same for the rule sets, so no check does a global lookup
+        forbidden_names = FORBIDDEN_NAMES
+        forbidden_attributes = FORBIDDEN_ATTRIBUTES
+        forbidden_prefixes = FORBIDDEN_ATTRIBUTE_PREFIXES
+        allowed_call_names = ALLOWED_CALL_NAMES
         
-        # SECURITY CHECK 4: Recursively validate all child nodes
-        # Walk the entire tree to check every single node
-        # If ANY child is dangerous, the whole code is dangerous
-        for child in ast.iter_child_nodes(node):
-            if not self._validate_ast(child):
-                return False  # Child node is dangerous!
+        stack = [node]
+        pop = stack.pop
+        push = stack.append
+        extend = stack.extend
+        while stack:
+            node = pop()
+            node_type = type(node)
+            
+            # SECURITY CHECK 3: Block dangerous name references
+            # Prevents even mentioning dangerous functions
+            # Example: x = open  (even without calling it)
+            # Dunder names are out too (__builtins__['print'] = ...)
+            if node_type is Name:
+                name = node.id
+                if name in forbidden_names or name.startswith('__'):
+                    return False  # Cannot even reference these names
+                continue  # Only child is the Load/Store context
+            
+            # SECURITY CHECK 5: Block dangerous attribute access
+            # Every dunder attribute is rejected: they are the way out
+            # of any Python sandbox, e.g.
+            # ().__class__.__bases__[0].__subclasses__()
+            # or move_forward.__globals__. So are frame attributes
+            # (gen.gi_frame.f_back.f_builtins reaches the real builtins);
+            # exec/eval are blocked as method names too
+            if node_type is Attribute:
+                attr = node.attr
+                if attr in forbidden_attributes or attr.startswith(forbidden_prefixes):
+                    return False  # Extremely dangerous!
+            
+            # SECURITY CHECK 2: Validate function calls
+            if node_type is Call:
+                func = node.func
+                func_type = type(func)
+                # Case A: Simple function call like move_forward()
+                if func_type is Name:
+                    # Check if function is in our whitelist
+                    if func.id not in allowed_call_names:
+                        return False  # Unknown function = dangerous
+                
+                # Case B: Attribute function call like obj.method()
+                # is checked when its Attribute child is popped (check 5)
+                
+                # Case C: anything else ([f][0](), f()(), (lambda: f)()())
+                # would call an object the whitelist never saw
+                elif func_type is not Attribute:
+                    return False
+            
+            # SECURITY CHECK 1: Block ALL imports
+            # Prevents: import os, from sys import exit, __import__('os')
+            elif node_type is Import or node_type is ImportFrom:
+                return False  # No imports of any kind allowed!
+            
+            # SECURITY CHECK 4: Queue all child nodes
+            # Walk the entire tree to check every single node
+            # If ANY child is dangerous, the whole code is dangerous
+            # (lists can also hold plain values, e.g. the names of a
+            # global statement; those have no _fields and are skipped)
+            for field in getattr(node_type, '_fields', ()):
+                value = getattr(node, field, None)
+                if isinstance(value, AST):
+                    push(value)
+                elif type(value) is list:
+                    extend(value)
         
-        # All checks passed - this node is safe
+        # All checks passed - every node is safe
         return True
     
-    def execute_code(self, code: str, player: Player, grid: Grid) -> Dict[str, Any]:
+    def execute_code(self, code: str, player: Player, grid: Grid,
+                     track_actions: bool = True) -> ExecutionResult:
         """
         Execute user code in a secure sandboxed environment (Security Layer 2).
         
@@ -297,7 +576,7 @@ class CodeExecutor:
         Security Protections:
             1. Restricted globals: Only game functions available
             2. Restricted builtins: Only safe Python builtins
-            3. Timeout protection: Kills infinite loops after N seconds
+            3. Timeout protection: Interrupts infinite loops after N seconds
             4. Exception handling: Catches and sanitizes errors
             5. Action tracking: Records all player actions
         
@@ -305,9 +584,13 @@ class CodeExecutor:
             code (str): User-submitted Python code (already validated by validate_code)
             player (Player): Player instance to control
             grid (Grid): Game grid to query
+            track_actions (bool): Record the actions performed (needed to
+                animate them). Pass False for runs that only need the end
+                state, e.g. grading; actions is then always empty.
         
         Returns:
-            Dict[str, Any]: Result dictionary with keys:
+            ExecutionResult: Result with fields (to_dict() gives the
+            equivalent dictionary):
                 - success (bool): True if code ran without errors
                 - actions (list): List of action strings performed
                 - execution_time (float): Time taken in seconds
@@ -315,70 +598,245 @@ class CodeExecutor:
         
         Performance:
             - Typical execution: 0.001-0.1 seconds
-            - Timeout kills execution after config.MAX_EXECUTION_TIME
-            - Action tracking has negligible overhead
+            - Timeout interrupts execution after config.MAX_EXECUTION_TIME.
+              Not a hard cap: a single long builtin call (e.g. sum() over
+              a huge range) finishes before the interrupt is delivered, and
+              without SIGALRM (Windows, worker threads) nothing is
+              interrupted, the overrun is only reported afterwards
+            - Action tracking costs one list append per move (skip it with
+              track_actions=False)
         
         Security Note:
-            This method assumes code has already been validated by validate_code().
-            Always call validate_code() BEFORE execute_code()!
+            Code that validate_code() rejects is never run: it fails with
+            a security violation error. Still call validate_code() first
+            to give the user feedback before anything executes.
         
         Example:
             >>> result = executor.execute_code("move_forward()", player, grid)
-            >>> result['success']
+            >>> result.success
             True
-            >>> result['actions']
+            >>> result.actions
             ['move_forward']
-            >>> result['execution_time']
+            >>> result.execution_time
             0.0012
         """
+        # Fast path: blank or comment-only code performs no actions
+        if _is_blank(code):
+            return ExecutionResult(True)
+        
+        return self._execute(code, player, grid, track_actions)
+    
+    def compile_code(self, code: str) -> Optional[CompiledSolution]:
+        """
+        Validate and compile user code once for repeated execution.
+        
+        Use together with execute_compiled() when the same solution runs
+        against several grids (e.g. checking it on a set of test levels):
+        parsing, validation and compilation happen here a single time.
+        
+        Args:
+            code (str): User-submitted Python code
+        
+        Returns:
+            Optional[CompiledSolution]: The compiled solution, or None if
+            the code has a syntax error or fails validation
+        
+        Example:
+            >>> solution = executor.compile_code("move_forward()")
+            >>> for player, grid in test_cases:
+            ...     result = executor.execute_compiled(solution, player, grid)
+        """
+        tree, code_object, verdict = self._compile_cached(code)
+        if verdict is not True:
+            return None
+        return CompiledSolution(code, tree, code_object)
+    
+    def execute_compiled(self, solution: CompiledSolution, player: Player,
+                         grid: Grid, track_actions: bool = True) -> ExecutionResult:
+        """
+        Execute a solution returned by compile_code() (Security Layer 2).
+        
+        Runs the precompiled code object in a fresh sandbox for the given
+        player and grid, with the same protections and ExecutionResult
+        as execute_code().
+        
+        Args:
+            solution (CompiledSolution): Validated code from compile_code()
+            player (Player): Player instance to control
+            grid (Grid): Game grid to query
+            track_actions (bool): Record the actions performed, see
+                execute_code()
+        
+        Returns:
+            ExecutionResult: Outcome of the run, see execute_code()
+        """
+        return self._execute(solution.code, player, grid, track_actions)
+    
+    def _execute(self, code, player: Player, grid: Grid,
+                 track_actions: bool) -> ExecutionResult:
+        """
+        Run code in a fresh sandbox, time it and build its ExecutionResult.
+        
+        Shared by execute_code() and execute_compiled().
+        
+        Args:
+            code: Code object, or source string to look up in the code cache
+            player (Player): Player instance to control
+            grid (Grid): Game grid to query
+            track_actions (bool): Record the actions performed
+        
+        Returns:
+            ExecutionResult: Outcome of the run, see execute_code()
+        
+        Note:
+            This is a private helper method (indicated by _ prefix).
+        """
         try:
+            # exec() runs the code object compiled from the validated tree
+            if type(code) is str:
+                tree, code_object, verdict = self._compile_cached(code)
+                if verdict is False:
+                    # Parsed but rejected by the validator: never run it,
+                    # even if the caller skipped validate_code()
+                    return ExecutionResult(
+                        False, error="Security violation: code contains forbidden operations")
+                if verdict is not True:
+                    # The cached SyntaxError, with its message and line
+                    # number for the student
+                    return ExecutionResult(
+                        False, error=f"{type(verdict).__name__}: {verdict}")
+                code = code_object
+            
             # SECURITY LAYER 2A: Create restricted execution environment
             # This dict contains ONLY allowed functions and builtins
             # User code cannot access anything not in this dict
-            exec_globals = self._create_execution_environment(player, grid)
-            exec_locals = {}  # Separate namespace for local variables
+            exec_globals = self._create_execution_environment(player, grid, track_actions)
+            # Held on to here: user code may rebind the _actions name
+            actions = exec_globals['_actions']
             
             # SECURITY LAYER 2B: Execute with timeout protection
-            # Record start time to detect infinite loops
-            start_time = time.time()
+            # Record start time (reported back as execution_time)
+            # perf_counter_ns: monotonic, so a wall-clock adjustment
+            # can't fake a timeout, and integer until the one conversion
+            start_ns = time.perf_counter_ns()
             
-            # Execute user code with restricted globals and locals
-            # exec() runs the code string as Python
-            # globals dict determines what functions/variables are available
-            exec(code, exec_globals, exec_locals)
+            # Execute user code in the restricted namespace, used for both
+            # globals and locals as in a module: separate locals would make
+            # top-level code behave like a class body, so helper functions
+            # couldn't see top-level variables or each other
+            finished = self._exec_with_timeout(code, exec_globals)
             
             # Calculate execution time
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
             
             # SECURITY LAYER 2C: Check for timeout
             # If code took too long, it's likely an infinite loop
             # Example blocked: while True: pass
-            if execution_time > self.execution_timeout:
-                return {
-                    "success": False,
-                    "error": f"Code execution timeout ({self.execution_timeout}s)",
-                    "actions": []
-                }
+            if not finished or execution_time > self.execution_timeout:
+                return ExecutionResult(
+                    False, error=f"Code execution timeout ({self.execution_timeout}s)")
             
             # SUCCESS: Code executed without errors
             # Return list of actions taken (for animation)
-            return {
-                "success": True,
-                "actions": exec_globals.get('_actions', []),  # Actions tracked during execution
-                "execution_time": execution_time
-            }
+            return ExecutionResult(
+                True,
+                actions,  # Actions tracked during execution
+                execution_time)
             
         except Exception as e:
             # SECURITY LAYER 2D: Catch and sanitize exceptions
             # Don't leak sensitive system information in error messages
             # Return user-friendly error string
-            return {
-                "success": False,
-                "error": str(e),  # Convert exception to string
-                "actions": []     # No actions if code failed
-            }
+            # (no actions if code failed)
+            error_type = type(e)
+            if error_type in USER_ERROR_TYPES:
+                # e.g. "NameError: name 'foo' is not defined"
+                message = str(e)
+                error = f"{error_type.__name__}: {message}" if message else error_type.__name__
+            else:
+                # Anything else came from inside the game or Python itself;
+                # its message may hold paths or internals, so name the type only
+                error = f"Execution error ({error_type.__name__})"
+            return ExecutionResult(False, error=error)
     
-    def _create_execution_environment(self, player: Player, grid: Grid) -> Dict[str, Any]:
+    def _exec_with_timeout(self, code, exec_globals: Dict[str, Any]) -> bool:
+        """
+        Run code, interrupting it once execution_timeout has passed.
+        
+        On POSIX systems, when called from the main thread, a one-shot
+        SIGALRM timer raises _ExecutionTimeout inside the user code, so
+        an infinite loop (while True: pass) is actually stopped instead
+        of freezing the game. User code can still catch the exception
+        (bare "except:", or "finally: continue" in a loop), so from then
+        on a trace function raises it again on every line of user code
+        until exec() has unwound. Elsewhere (Windows, or a worker
+        thread, where signal handlers can't be installed) the code runs
+        to completion and _execute() falls back to comparing the
+        measured time against the limit.
+        
+        Args:
+            code: Code object (or source string) to execute
+            exec_globals (Dict[str, Any]): Restricted namespace
+        
+        Returns:
+            bool: True if the code finished, False if it was interrupted
+        
+        Note:
+            A worker thread is deliberately not used as a fallback:
+            Python can't kill a thread, so a runaway loop would keep
+            moving the live Player in the background.
+            
+            This is a private helper method (indicated by _ prefix).
+        """
+        if (not hasattr(signal, 'setitimer')
+                or threading.current_thread() is not threading.main_thread()):
+            exec(code, exec_globals)
+            return True
+        
+        timed_out = []
+        
+        def interrupt(frame, event, arg):
+            # Trace function: user code may not run another line
+            if frame.f_code.co_filename != '<string>':
+                return None  # Game API and builtins: don't trace
+            if event == 'call' or event == 'line':
+                raise _ExecutionTimeout()
+            return interrupt
+        
+        def on_timeout(signum, frame):
+            # SIGALRM handler: interrupt the running user code, and trace
+            # its frames (and any it calls) so handlers can't resume it
+            timed_out.append(True)
+            sys.settrace(interrupt)
+            while frame is not None:
+                if frame.f_code.co_filename == '<string>':
+                    frame.f_trace = interrupt
+                frame = frame.f_back
+            raise _ExecutionTimeout()
+        
+        previous_handler = signal.signal(signal.SIGALRM, on_timeout)
+        previous_trace = sys.gettrace()
+        try:
+            try:
+                signal.setitimer(signal.ITIMER_REAL, self.execution_timeout)
+                exec(code, exec_globals)
+            finally:
+                # Cancel the timer before anything else can be interrupted
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        except BaseException:
+            if not timed_out:
+                raise  # A genuine error in the user code
+            # Timed out, even if user code turned the interrupt into
+            # another exception (e.g. a failing bare "except:" handler)
+            return False
+        finally:
+            signal.signal(signal.SIGALRM, previous_handler)
+            if timed_out:
+                sys.settrace(previous_trace)
+        return True
+    
+    def _create_execution_environment(self, player: Player, grid: Grid,
+                                      track_actions: bool = True) -> Dict[str, Any]:
         """
         Create sandboxed execution environment with wrapper functions.
         
@@ -394,6 +852,16 @@ class CodeExecutor:
             - Wrappers delegate to actual player/grid methods
             - Closures capture player/grid instances
             - Action list is shared across all wrappers
+            - Restricted builtins are prepared once in __init__
+        
+        Why Closures (not callable objects):
+            A closure keeps player/grid in a cell, reachable only through
+            dunder attributes; a slotted callable class would expose them
+            as plain attributes (move_forward.player). Creating the 11
+            closures costs well under a microsecond per run. Bound methods
+            of a wrapper object were tried too: they build a bit faster,
+            but a wrong call then counts self ("move_forward() takes 1
+            positional argument but 2 were given"), which misleads students.
         
         Security:
             - User code CANNOT access player or grid directly
@@ -404,6 +872,8 @@ class CodeExecutor:
         Args:
             player (Player): Player instance to control (captured by closures)
             grid (Grid): Grid instance to query (captured by closures)
+            track_actions (bool): If False, the movement wrappers skip
+                recording and _actions stays empty
         
         Returns:
             Dict[str, Any]: Execution namespace with:
@@ -421,6 +891,13 @@ class CodeExecutor:
             
             Wrappers control exactly what user code can do.
         """
+        # Per-run answers of is_clear()/is_goal(), keyed by tile: walls and
+        # goals can't change while user code runs (only the player moves),
+        # so each tile is asked of the grid once. Gems can be collected,
+        # so is_gem() is never cached.
+        clear_tiles = {}
+        goal_tiles = {}
+        
         # Action tracking list shared by all wrapper functions
         # Each wrapper appends its action name here
         # This allows us to animate the sequence of moves
@@ -429,47 +906,70 @@ class CodeExecutor:
         # ==================== MOVEMENT FUNCTIONS ====================
         # These wrappers modify player state
         
-        def move_forward():
-            """
-            User-callable function to move player forward.
+        if track_actions:
+            # Bound once, so a move doesn't look up actions.append
+            record = actions.append
             
-            This wrapper:
-                1. Records the action for animation
-                2. Delegates to player.move_forward()
-                3. Returns new position
+            def move_forward():
+                """
+                User-callable function to move player forward.
+                
+                This wrapper:
+                    1. Records the action for animation
+                    2. Delegates to player.move_forward()
+                    3. Returns new position
+                
+                Returns:
+                    Tuple[int, int]: New player position after move
+                """
+                record("move_forward")  # Track for animation
+                return player.move_forward()  # Actual movement
             
-            Returns:
-                Tuple[int, int]: New player position after move
-            """
-            actions.append("move_forward")  # Track for animation
-            return player.move_forward()    # Actual movement
-        
-        def turn_left():
-            """
-            User-callable function to turn player left.
+            def turn_left():
+                """
+                User-callable function to turn player left.
+                
+                Rotates player 90° counter-clockwise.
+                """
+                record("turn_left")
+                player.turn_left()
             
-            Rotates player 90° counter-clockwise.
-            """
-            actions.append("turn_left")
-            player.turn_left()
-        
-        def turn_right():
-            """
-            User-callable function to turn player right.
+            def turn_right():
+                """
+                User-callable function to turn player right.
+                
+                Rotates player 90° clockwise.
+                """
+                record("turn_right")
+                player.turn_right()
             
-            Rotates player 90° clockwise.
-            """
-            actions.append("turn_right")
-            player.turn_right()
+            def turn_around():
+                """
+                User-callable function to turn player 180°.
+                
+                Faces player in opposite direction.
+                """
+                record("turn_around")
+                player.turn_around()
         
-        def turn_around():
-            """
-            User-callable function to turn player 180°.
+        else:
+            # Untracked run: same moves, nothing recorded
             
-            Faces player in opposite direction.
-            """
-            actions.append("turn_around")
-            player.turn_around()
+            def move_forward():
+                """User-callable function to move player forward."""
+                return player.move_forward()
+            
+            def turn_left():
+                """User-callable function to turn player left."""
+                player.turn_left()
+            
+            def turn_right():
+                """User-callable function to turn player right."""
+                player.turn_right()
+            
+            def turn_around():
+                """User-callable function to turn player 180°."""
+                player.turn_around()
         
         # ==================== SENSING FUNCTIONS ====================
         # These wrappers query world state (read-only, safe)
@@ -487,8 +987,12 @@ class CodeExecutor:
             """
             # Get position player would move to
             next_pos = player.get_next_position()
-            # Check if that position is not a wall
-            return not grid.is_wall(next_pos[0], next_pos[1])
+            clear = clear_tiles.get(next_pos)
+            if clear is None:
+                # Check if that position is not a wall (first time only)
+                clear = not grid.is_wall(next_pos[0], next_pos[1])
+                clear_tiles[next_pos] = clear
+            return clear
         
         def is_gem() -> bool:
             """
@@ -508,7 +1012,11 @@ class CodeExecutor:
                 bool: True if on goal tile, False otherwise
             """
             pos = player.get_position()
-            return grid.is_goal(pos[0], pos[1])
+            goal = goal_tiles.get(pos)
+            if goal is None:
+                goal = grid.is_goal(pos[0], pos[1])
+                goal_tiles[pos] = goal
+            return goal
         
         def at_goal() -> bool:
             """
@@ -554,20 +1062,17 @@ class CodeExecutor:
         # ==================== RESTRICTED BUILTINS ====================
         # Only allow safe Python built-in functions
         # This replaces the full __builtins__ dict with a restricted version
+        # (built once in __init__ as a read-only mapping, so it is shared
+        # by every run without copying)
         
-        restricted_builtins = {
-            name: getattr(__builtins__, name) 
-            for name in self.allowed_builtins 
-            if hasattr(__builtins__, name)
-        }
+        restricted_builtins = self._restricted_builtins
         # Result: Only print, len, range, etc. are available
-        # Missing: open, eval, exec, __import__, compile (all blocked!)
         
         # ==================== BUILD EXECUTION NAMESPACE ====================
         # This dict defines EVERYTHING available to user code
         # If it's not in this dict, user code cannot access it
         
-        return {
+        namespace = {
             # Movement functions - modify player state
             'move_forward': move_forward,
             'turn_left': turn_left,
@@ -593,3 +1098,10 @@ class CodeExecutor:
             # Underscore prefix indicates "private" but still accessible
             '_actions': actions
         }
+        
+        # Error messages name functions by __qualname__; show students
+        # "move_forward() takes 0 positional arguments", not the
+        # "CodeExecutor._create_execution_environment.<locals>." path
+        for name in ALLOWED_FUNCTIONS:
+            namespace[name].__qualname__ = name
+        return namespace
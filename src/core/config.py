@@ -30,9 +30,9 @@ Last Modified: October 2, 2025
 import os
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Tuple, List
+from typing import ClassVar, Set, Tuple, List
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """
     Global configuration settings for the entire game.
@@ -45,6 +45,9 @@ class Config:
         - Default values
         - Automatic __init__ and __repr__
         - Field-level customization with field()
+        - __slots__ (slots=True): no per-instance __dict__, and a typo
+          like config.GRIDSIZE = 15 raises AttributeError instead of
+          silently adding a new attribute
     
     Categories:
         - Window: Display size and title
@@ -135,6 +138,10 @@ class Config:
                                                                # Users can't import os, sys, etc.
                                                                # field(default_factory=list) needed for mutable defaults
     
+    # Directories __post_init__ already created or found in this process
+    # (shared by all instances, so later Config() calls skip the mkdirs)
+    _ensured_dirs: ClassVar[Set[Path]] = set()
+    
     def __post_init__(self):
         """
         Post-initialization hook called after dataclass __init__.
@@ -158,14 +165,19 @@ class Config:
         
         Note:
             This is safe to call multiple times - it won't overwrite existing files.
+            Each directory is only created once per process: later Config()
+            instances with the same paths skip the mkdir syscalls.
         """
-        # Create asset directory if it doesn't exist
-        # parents=True: create parent directories if needed
-        # exist_ok=True: don't raise error if directory already exists
-        self.ASSETS_DIR.mkdir(parents=True, exist_ok=True)
-        
-        # Create levels directory for JSON level files
-        self.LEVELS_DIR.mkdir(parents=True, exist_ok=True)
+        ensured = Config._ensured_dirs
         
-        # Create data directory for user progress and achievements
-        self.DATA_DIR.mkdir(parents=True, exist_ok=True)
+        # ASSETS_DIR: sprites, sounds
+        # LEVELS_DIR: JSON level files
+        # DATA_DIR: user progress and achievements
+        for directory in (self.ASSETS_DIR, self.LEVELS_DIR, self.DATA_DIR):
+            if directory in ensured:
+                continue  # Already created (or found) earlier
+            # Create directory if it doesn't exist
+            # parents=True: create parent directories if needed
+            # exist_ok=True: don't raise error if directory already exists
+            directory.mkdir(parents=True, exist_ok=True)
+            ensured.add(directory)
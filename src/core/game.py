@@ -621,12 +621,12 @@ class Game:
             result = self.code_executor.execute_code(code, self.player, self.grid)
             
             # STEP 3: Process execution result
-            if result["success"]:
+            if result.success:
                 # Code ran successfully!
                 
                 # Queue all actions for animation
                 # Actions are strings like "move_forward", "turn_left"
-                self.animation_queue.extend(result["actions"])
+                self.animation_queue.extend(result.actions)
                 
                 # Start animating if there are actions
                 if self.animation_queue:
@@ -635,7 +635,7 @@ class Game:
                 return True, "Code executed successfully"
             else:
                 # Code failed with an error
-                return False, result["error"]
+                return False, result.error
                 
         except Exception as e:
             # Unexpected error (shouldn't happen if CodeExecutor is working)
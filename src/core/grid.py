@@ -133,6 +133,57 @@ class Grid:
         self.gems: List[Tuple[int, int]] = []   # Positions of collectible gems
         self.goals: List[Tuple[int, int]] = []  # Positions of goal tiles
     
+    @classmethod
+    def from_level(cls, level) -> 'Grid':
+        """
+        Build a grid populated with a level's walls, gems, and goal.
+        
+        Bulk alternative to calling set_tile() once per element: tiles
+        are written straight into the rows and the gem/goal tracking
+        lists are filled in the same pass, skipping set_tile()'s
+        per-call bounds check and list membership scans.
+        
+        Produces the same state as placing walls, then gems, then the
+        goal with set_tile(). Out-of-bounds positions are skipped.
+        
+        Args:
+            level: Any object with grid_size, obstacles, gems and
+                   goal_pos attributes (normally a Level)
+        
+        Returns:
+            Grid: New grid_size × grid_size grid for the level
+        
+        Example:
+            >>> level = Level((0, 0), (4, 4), [(2, 2)], [(1, 1)], 5)
+            >>> grid = Grid.from_level(level)
+            >>> grid.is_wall(2, 2), grid.get_gem_count(), grid.goals
+            (True, 1, [(4, 4)])
+        """
+        size = level.grid_size
+        grid = cls(size, size)
+        tiles = grid.tiles
+        wall, gem = TileType.WALL, TileType.GEM
+        
+        for x, y in level.obstacles:
+            if 0 <= x < size and 0 <= y < size:
+                tiles[y][x] = wall
+        
+        # Walls are never tracked, so a tile that is already a GEM is
+        # exactly a position already in the gems list (duplicate entry)
+        gems = grid.gems
+        for x, y in level.gems:
+            if 0 <= x < size and 0 <= y < size:
+                if tiles[y][x] is not gem:
+                    gems.append((x, y))
+                tiles[y][x] = gem
+        
+        goal_x, goal_y = level.goal_pos
+        if 0 <= goal_x < size and 0 <= goal_y < size:
+            tiles[goal_y][goal_x] = TileType.GOAL
+            grid.goals.append((goal_x, goal_y))
+        
+        return grid
+    
     def get_tile(self, x: int, y: int) -> TileType:
         """
         Get the tile type at the specified position.
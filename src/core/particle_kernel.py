@@ -0,0 +1,113 @@
+"""
+Particle physics kernel for ArrayParticleSystem.
+
+One function, step(), advances every live particle by dt and compacts
+the survivors to the front of the arrays. Two implementations share
+the same signature:
+
+- A single fused loop compiled with Numba (when numba is installed).
+  Each particle is read once, updated in registers and written once to
+  its compacted slot, instead of one full array pass per operation.
+- A NumPy fallback doing the same work as whole-array operations.
+
+Functions:
+    step: Update particles and remove dead ones, returning the new count
+
+Constants:
+    HAS_NUMBA: True if the compiled kernel is in use
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+HAS_NUMBA = njit is not None
+
+
+def _step_loop(x, y, vx, vy, lifetime, max_lifetime, size, initial_size, color,
+               n, dt, gravity):
+    """
+    Fused update + compaction loop (compiled by Numba).
+
+    Survivors are written to index `alive`, which never runs ahead of
+    the read index, so compaction is safe in place and keeps order.
+    """
+    alive = 0
+    for i in range(n):
+        remaining = lifetime[i] - dt
+        if remaining <= 0:
+            continue
+
+        # Same order as Particle.update: position uses the old velocity
+        x[alive] = x[i] + vx[i] * dt
+        y[alive] = y[i] + vy[i] * dt
+        vy[alive] = vy[i] + gravity * dt
+        lifetime[alive] = remaining
+        size[alive] = initial_size[i] * (remaining / max_lifetime[i])
+
+        # Constant fields only move once a particle before this one died
+        if alive != i:
+            vx[alive] = vx[i]
+            max_lifetime[alive] = max_lifetime[i]
+            initial_size[alive] = initial_size[i]
+            color[alive, 0] = color[i, 0]
+            color[alive, 1] = color[i, 1]
+            color[alive, 2] = color[i, 2]
+        alive += 1
+    return alive
+
+
+def _step_numpy(x, y, vx, vy, lifetime, max_lifetime, size, initial_size, color,
+                n, dt, gravity):
+    """
+    Vectorized NumPy version of _step_loop (used without Numba).
+
+    NumPy can't fuse the operations into one pass, but every step runs
+    in place: size is recomputed last, so its slice doubles as scratch
+    space for the velocity * dt products and no temporaries are created.
+    """
+    # Slices are views, so in-place ops write straight into the arrays
+    x, y, vx, vy = x[:n], y[:n], vx[:n], vy[:n]
+    scratch = size[:n]
+
+    # Integrate with the old velocity, then apply gravity
+    np.multiply(vx, dt, out=scratch)
+    x += scratch
+    np.multiply(vy, dt, out=scratch)
+    y += scratch
+    vy += gravity * dt
+
+    # Age and shrink: size = initial_size * (lifetime / max_lifetime)
+    lifetime[:n] -= dt
+    np.divide(lifetime[:n], max_lifetime[:n], out=scratch)
+    scratch *= initial_size[:n]
+
+    # Compact: move survivors to the front, keeping their order
+    mask = lifetime[:n] > 0
+    alive = int(np.count_nonzero(mask))
+    if alive != n:
+        for array in (x, y, vx, vy, lifetime, max_lifetime, size, initial_size, color):
+            array[:alive] = array[:n][mask]
+    return alive
+
+
+# Types ArrayParticleSystem passes in: contiguous float32 columns, an
+# (n, 3) uint8 color array, then count, dt and gravity
+_STEP_SIGNATURE = ('int64(' + 'float32[::1], ' * 8 +
+                   'uint8[:, ::1], int64, float64, float64)')
+
+if HAS_NUMBA:
+    # The explicit signature compiles eagerly, at import instead of in
+    # the frame of the first gem burst, and cache=True stores the
+    # compiled kernel on disk, so only the very first run pays for it
+    step = njit(_STEP_SIGNATURE, cache=True, fastmath=True, boundscheck=False)(_step_loop)
+    # One empty call sets up the dispatcher's argument handling (~10-30ms
+    # on the first call even when compiled) before any frame needs it
+    _empty = np.zeros(1, dtype=np.float32)
+    step(*([_empty] * 8), np.zeros((1, 3), dtype=np.uint8), 0, 0.0, 0.0)
+    del _empty
+else:
+    step = _step_numpy
@@ -27,7 +27,11 @@ from .grid import Grid, TileType
 from .player import Player
 from .level import Level
 from .sprite_manager import SpriteManager
-from .animation import ParticleSystem
+from .animation import ParticleSystem, ArrayParticleSystem
+
+# Above this many live particles, draw each particle as one pixel written
+# with NumPy into a layer surface, instead of blitting one sprite each
+DENSE_PARTICLE_THRESHOLD = 1024
 
 class Renderer:
     """
@@ -80,6 +84,15 @@ class Renderer:
         # This loads all sprites from assets/sprites/
         self.sprite_manager = SpriteManager()
         
+        # Scale all sprites to tile size once, so render_grid() only blits
+        self.sprite_manager.prescale((config.TILE_SIZE, config.TILE_SIZE))
+        
+        # Gem sparkle sprite at every particle diameter (index = diameter)
+        self.particle_sprites = self.sprite_manager.get_particle_sprites('gem_yellow')
+        
+        # Screen-sized layer for dense particle effects (created on first use)
+        self.particle_layer: Optional[pygame.Surface] = None
+        
         # Initialize particle system for visual effects
         # Handles gem collection sparkles, explosions, etc.
         self.particle_system = ParticleSystem()
@@ -182,9 +195,14 @@ class Renderer:
             EMPTY tiles don't draw anything (floor is already drawn).
             This is a private helper method (indicated by _ prefix).
         """
+        # Most tiles are empty: leave before the type checks below.
+        # Identity checks (is) - Enum members are singletons.
+        if tile_type is TileType.EMPTY:
+            return
+        
         tile_size = (self.config.TILE_SIZE, self.config.TILE_SIZE)
         
-        if tile_type == TileType.WALL:
+        if tile_type is TileType.WALL:
             # Draw stone wall sprite
             wall_sprite = self.sprite_manager.get_tile_sprite('wall', tile_size)
             if wall_sprite:
@@ -193,7 +211,7 @@ class Renderer:
                 # Fallback: solid color rectangle
                 pygame.draw.rect(self.screen, self.config.WALL_COLOR, rect)
         
-        elif tile_type == TileType.GEM:
+        elif tile_type is TileType.GEM:
             # Draw animated gem sprite (pulsing animation)
             gem_sprite = self.sprite_manager.get_gem_sprite(tile_size)
             if gem_sprite:
@@ -203,7 +221,7 @@ class Renderer:
                 center = rect.center
                 pygame.draw.circle(self.screen, self.config.GEM_COLOR, center, self.config.TILE_SIZE // 3)
         
-        elif tile_type == TileType.GOAL:
+        elif tile_type is TileType.GOAL:
             # Draw animated goal sprite (glowing animation)
             goal_sprite = self.sprite_manager.get_goal_sprite(tile_size)
             if goal_sprite:
@@ -374,29 +392,86 @@ class Renderer:
         Used for visual feedback when collecting gems, explosions, etc.
         
         Performance:
-            Particles are small sprites (8-16px). Even with 50+ particles,
-            rendering is very fast (< 0.5ms).
-        """
-        # Get all active particles from particle system
-        for particle in self.particle_system.get_particles():
-            # Try to draw with particle sprite
-            particle_sprite = self.sprite_manager.get_particle_sprite(
-                'gem_yellow',  # Gem sparkle sprite
-                (int(particle.size * 2), int(particle.size * 2))  # Scale to particle size
-            )
+            Particles are small sprites (up to 12px) cut from the sprite
+            atlas, pre-scaled to every diameter in __init__, and drawn in a
+            single Surface.blits() batch. NumPy systems hand over their
+            typed arrays, so offsets are computed in bulk. Even with 50+
+            particles, rendering is very fast (< 0.5ms).
             
-            if particle_sprite:
-                # Draw sprite centered on particle position
-                rect = particle_sprite.get_rect(center=(int(particle.x), int(particle.y)))
-                self.screen.blit(particle_sprite, rect)
-            else:
-                # Fallback: simple colored circle
-                pygame.draw.circle(
-                    self.screen,
-                    particle.color,  # Particle color
-                    (int(particle.x), int(particle.y)),  # Position
-                    int(particle.size)  # Radius
-                )
+            Past DENSE_PARTICLE_THRESHOLD particles (NumPy systems only),
+            see _render_particles_dense().
+        """
+        count = len(self.particle_system)
+        if not count:
+            return  # No active effects this frame
+        
+        if count > DENSE_PARTICLE_THRESHOLD and isinstance(self.particle_system, ArrayParticleSystem):
+            self._render_particles_dense()
+            return
+        
+        sprites = self.particle_sprites
+        
+        # Sprite per diameter, top-left offset so it is centered on the
+        # particle; all drawn with one blits() call
+        if isinstance(self.particle_system, ArrayParticleSystem):
+            # Work on the typed arrays directly: diameters and offsets are
+            # computed for all particles at once (astype(int) truncates
+            # like int()), and no per-particle color tuples are built
+            xs, ys, sizes, _, _ = self.particle_system.get_arrays()
+            diameters = (sizes * 2).astype(int)
+            halves = diameters // 2
+            lefts = (xs.astype(int) - halves).tolist()
+            tops = (ys.astype(int) - halves).tolist()
+            blit_sequence = [(sprites[diameter], (left, top))
+                             for diameter, left, top in zip(diameters.tolist(), lefts, tops)]
+        else:
+            xs, ys, sizes, _, _ = self.particle_system.get_render_data()
+            blit_sequence = []
+            for x, y, size in zip(xs, ys, sizes):
+                diameter = int(size * 2)
+                half = diameter // 2
+                blit_sequence.append((sprites[diameter], (int(x) - half, int(y) - half)))
+        
+        self.screen.blits(blit_sequence, doreturn=False)
+    
+    def _render_particles_dense(self):
+        """
+        Draw every particle as a single pixel on a layer, then blit it once.
+        
+        Used for very large bursts, where one sprite blit per particle
+        becomes the bottleneck. Positions, colors and fade alphas are
+        scattered into the layer's pixel arrays with NumPy fancy
+        indexing (zero-copy views from pygame.surfarray), so the whole
+        effect costs one fill, one scatter and one blit.
+        
+        Note:
+            This is a private helper method (indicated by _ prefix).
+        """
+        xs, ys, _, fades, colors = self.particle_system.get_arrays()
+        
+        layer = self.particle_layer
+        if layer is None or layer.get_size() != self.screen.get_size():
+            layer = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+            self.particle_layer = layer
+        layer.fill((0, 0, 0, 0))
+        
+        # Integer pixel coordinates, keeping only particles on screen
+        width, height = layer.get_size()
+        xs = xs.astype(int)
+        ys = ys.astype(int)
+        visible = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        xs = xs[visible]
+        ys = ys[visible]
+        
+        # surfarray arrays are indexed [x, y]; views lock the surface
+        # until deleted, so drop them before blitting
+        rgb = pygame.surfarray.pixels3d(layer)
+        alpha = pygame.surfarray.pixels_alpha(layer)
+        rgb[xs, ys] = colors[visible]
+        alpha[xs, ys] = (255 * fades[visible]).astype('uint8')
+        del rgb, alpha
+        
+        self.screen.blit(layer, (0, 0))
     
     def emit_collect_particles(self, x: int, y: int):
         """
@@ -11,6 +11,11 @@ This module handles all sprite assets for the game including:
 All sprites are located in assets/sprites/ and are automatically
 loaded on initialization. Animations are updated frame-by-frame.
 
+Sprites are packed into a single texture atlas (atlas.png) with a JSON
+index (atlas.json) mapping sprite names to rectangles. Each sprite is a
+subsurface of the atlas, so only one image is decoded at startup.
+Individual PNG files are still loaded as a fallback if no atlas exists.
+
 Classes:
     SpriteManager: Main sprite loading and animation manager
 
@@ -22,12 +27,25 @@ Sprite Naming Convention:
     - particle_{color}.png            (e.g., particle_gem_yellow.png)
 """
 
+import json
 import pygame
 from pathlib import Path
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from enum import Enum
 
 
+# Particle colors, used to draw a plain circle sprite if a particle
+# sprite is missing from the assets (so renderers never need a fallback)
+PARTICLE_COLORS = {
+    'gem_yellow': (241, 196, 15),
+    'goal_green': (46, 204, 113),
+    'player_blue': (52, 152, 219),
+}
+
+# Largest particle diameter in pixels (ParticleSystem sizes are 2-6 radius)
+PARTICLE_MAX_DIAMETER = 12
+
+
 class SpriteManager:
     """
     Manages loading, caching, and animating all pixel art sprites.
@@ -36,7 +54,7 @@ class SpriteManager:
     1. Loading all sprites from disk (assets/sprites/)
     2. Caching sprites in memory (dictionary lookup)
     3. Managing animations (frame progression)
-    4. Scaling sprites to requested sizes
+    4. Scaling sprites to requested sizes (and caching the results)
     
     All sprites are loaded once on initialization and cached.
     Animations automatically cycle through frames when update() is called.
@@ -52,7 +70,7 @@ class SpriteManager:
     Performance:
         - Initial load time: ~50-100ms (loads all sprites)
         - Per-frame lookup: < 0.01ms (dictionary lookup)
-        - Scaling: < 0.1ms per sprite (hardware-accelerated)
+        - Scaling: < 0.1ms per sprite, once per size (cached afterwards)
     """
     
     def __init__(self, assets_path: Optional[Path] = None):
@@ -85,6 +103,21 @@ class SpriteManager:
         # Sprite cache: sprite_name -> pygame.Surface
         self.sprites: Dict[str, pygame.Surface] = {}
         
+        # Scaled copies: (sprite_name, (width, height)) -> pygame.Surface
+        # Filled lazily by get_sprite() so each size is scaled only once
+        self.scaled_sprites: Dict[Tuple[str, Tuple[int, int]], pygame.Surface] = {}
+        
+        # Names of sprites drawn in code because their asset was missing
+        self.generated_sprites = set()
+        
+        # Faded copies: (sprite_name, size, alpha_bucket) -> pygame.Surface
+        # Lets renderers fade sprites without calling set_alpha() on shared surfaces
+        self.faded_sprites: Dict[Tuple[str, Optional[Tuple[int, int]], int], pygame.Surface] = {}
+        
+        # Texture atlas (None if assets only contain individual PNGs)
+        self.atlas: Optional[pygame.Surface] = None
+        self.atlas_index: Dict[str, list] = {}  # sprite_name -> [x, y, w, h]
+        
         # Animation data structures
         self.animations: Dict[str, list] = {}  # animation_name -> [frame_names]
         self.animation_speeds: Dict[str, float] = {}  # animation_name -> seconds_per_frame
@@ -93,12 +126,13 @@ class SpriteManager:
         
         # Load all sprites from disk
         self._load_sprites()
+        self._generate_missing_particles()
     
     def _load_sprites(self):
         """
         Load all sprite assets from disk.
         
-        Scans the assets/sprites/ directory and loads all recognized sprites:
+        Loads all recognized sprites from the atlas (or individual PNGs):
         - Player sprites (8 total: 4 directions × 2 frames)
         - Tile sprites (3 total: floor, grass, wall)
         - Gem animation (4 frames)
@@ -123,6 +157,9 @@ class SpriteManager:
             print(f"Warning: Sprites directory not found at {self.assets_path}")
             return
         
+        # Decode the atlas once; sprites below are cut from it
+        self._load_atlas()
+        
         # === LOAD PLAYER SPRITES ===
         # Player has 4 directions, each with 2 idle animation frames
         for direction in ['north', 'south', 'east', 'west']:
@@ -131,11 +168,8 @@ class SpriteManager:
             # Load both frames for this direction
             for frame in range(2):
                 sprite_name = f"player_{direction}_{frame}"
-                sprite_path = self.assets_path / f"{sprite_name}.png"
                 
-                if sprite_path.exists():
-                    # Load sprite with alpha transparency
-                    self.sprites[sprite_name] = pygame.image.load(str(sprite_path)).convert_alpha()
+                if self._load_sprite(sprite_name):
                     animation_frames.append(sprite_name)
             
             # Create animation sequence if frames were found
@@ -149,21 +183,15 @@ class SpriteManager:
         # === LOAD TILE SPRITES ===
         # Tiles are static (no animation)
         for tile_type in ['floor', 'grass', 'wall']:
-            sprite_name = f"tile_{tile_type}"
-            sprite_path = self.assets_path / f"{sprite_name}.png"
-            
-            if sprite_path.exists():
-                self.sprites[sprite_name] = pygame.image.load(str(sprite_path)).convert_alpha()
+            self._load_sprite(f"tile_{tile_type}")
         
         # === LOAD GEM ANIMATION ===
         # Gem has 4 frames for pulsing/rotating animation
         gem_frames = []
         for frame in range(4):
             sprite_name = f"gem_{frame}"
-            sprite_path = self.assets_path / f"{sprite_name}.png"
             
-            if sprite_path.exists():
-                self.sprites[sprite_name] = pygame.image.load(str(sprite_path)).convert_alpha()
+            if self._load_sprite(sprite_name):
                 gem_frames.append(sprite_name)
         
         # Create gem animation if frames were found
@@ -178,10 +206,8 @@ class SpriteManager:
         goal_frames = []
         for frame in range(4):
             sprite_name = f"goal_{frame}"
-            sprite_path = self.assets_path / f"{sprite_name}.png"
             
-            if sprite_path.exists():
-                self.sprites[sprite_name] = pygame.image.load(str(sprite_path)).convert_alpha()
+            if self._load_sprite(sprite_name):
                 goal_frames.append(sprite_name)
         
         # Create goal animation if frames were found
@@ -193,12 +219,66 @@ class SpriteManager:
         
         # === LOAD PARTICLE SPRITES ===
         # Particles are static (no animation) but come in different colors
-        for color in ['gem_yellow', 'goal_green', 'player_blue']:
+        for color in PARTICLE_COLORS:
+            self._load_sprite(f"particle_{color}")
+    
+    def _generate_missing_particles(self):
+        """
+        Draw a plain circle for every particle color whose sprite is missing.
+        
+        Particles are created in code and may appear anywhere, so unlike
+        tiles they always need a sprite. Generating one here means
+        renderers never need a per-particle fallback path.
+        """
+        for color, rgb in PARTICLE_COLORS.items():
             sprite_name = f"particle_{color}"
+            if sprite_name not in self.sprites:
+                sprite = pygame.Surface((8, 8), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, rgb, (4, 4), 4)
+                self.sprites[sprite_name] = sprite
+                self.generated_sprites.add(sprite_name)
+    
+    def _load_atlas(self):
+        """
+        Load the texture atlas and its JSON index, if present.
+        
+        Side Effects:
+            - Sets self.atlas and self.atlas_index
+            - Leaves both empty if atlas.png or atlas.json is missing
+        """
+        atlas_path = self.assets_path / "atlas.png"
+        index_path = self.assets_path / "atlas.json"
+        
+        if atlas_path.exists() and index_path.exists():
+            with open(index_path, 'r') as f:
+                self.atlas_index = json.load(f)
+            self.atlas = pygame.image.load(str(atlas_path)).convert_alpha()
+    
+    def _load_sprite(self, sprite_name: str) -> Optional[pygame.Surface]:
+        """
+        Load a single sprite into the cache.
+        
+        Cuts the sprite out of the atlas when it is indexed there
+        (a subsurface shares the atlas pixels, no copy is made).
+        Otherwise falls back to <sprite_name>.png.
+        
+        Args:
+            sprite_name (str): Sprite key (e.g., "tile_floor", "gem_0")
+        
+        Returns:
+            Optional[pygame.Surface]: Loaded sprite, or None if not found
+        """
+        if self.atlas is not None and sprite_name in self.atlas_index:
+            sprite = self.atlas.subsurface(pygame.Rect(self.atlas_index[sprite_name]))
+        else:
             sprite_path = self.assets_path / f"{sprite_name}.png"
-            
-            if sprite_path.exists():
-                self.sprites[sprite_name] = pygame.image.load(str(sprite_path)).convert_alpha()
+            if not sprite_path.exists():
+                return None
+            # Load sprite with alpha transparency
+            sprite = pygame.image.load(str(sprite_path)).convert_alpha()
+        
+        self.sprites[sprite_name] = sprite
+        return sprite
     
     def update(self, dt: float):
         """
@@ -246,18 +326,40 @@ class SpriteManager:
             Optional[pygame.Surface]: Sprite surface, or None if not found
         
         Note:
-            Scaling is done on-the-fly. Consider caching if performance
-            becomes an issue.
+            Scaled sprites are cached per (name, size), so the render loop
+            only pays for pygame.transform.scale the first time a size is
+            requested. Returned surfaces are shared - don't draw on them.
         """
         # Look up sprite in cache
         sprite = self.sprites.get(sprite_name)
         
-        # Scale if size is specified
+        # Scale if size is specified (once per size)
         if sprite and size:
-            return pygame.transform.scale(sprite, size)
+            key = (sprite_name, size)
+            scaled = self.scaled_sprites.get(key)
+            if scaled is None:
+                scaled = pygame.transform.scale(sprite, size)
+                self.scaled_sprites[key] = scaled
+            return scaled
         
         return sprite  # Original size or None
     
+    def prescale(self, size: Tuple[int, int]):
+        """
+        Scale every loaded sprite to the given size up front.
+        
+        Fills the scaled-sprite cache at startup so the first rendered
+        frame doesn't pay for the scaling.
+        
+        Args:
+            size (Tuple[int, int]): Target size (width, height)
+        
+        Example:
+            >>> sprite_manager.prescale((40, 40))  # Warm cache for TILE_SIZE
+        """
+        for sprite_name in self.sprites:
+            self.get_sprite(sprite_name, size)
+    
     def get_animated_sprite(self, animation_name: str, size: Optional[Tuple[int, int]] = None) -> Optional[pygame.Surface]:
         """
         Get the current frame of an animation.
@@ -290,6 +392,26 @@ class SpriteManager:
         # Return the sprite (possibly scaled)
         return self.get_sprite(sprite_name, size)
     
+    def get_animation_frames(self, animation_name: str, size: Optional[Tuple[int, int]] = None) -> List[pygame.Surface]:
+        """
+        Get every frame of an animation, optionally scaled.
+        
+        Lets callers resolve (and scale) all frames once, then pick the
+        current one with current_frames[animation_name] each frame.
+        
+        Args:
+            animation_name (str): Animation key (e.g., "gem", "player_north")
+            size (Optional[Tuple[int, int]]): Target size for scaling
+        
+        Returns:
+            List[pygame.Surface]: Frames in order (empty if animation not found)
+        
+        Example:
+            >>> gem_frames = sprite_manager.get_animation_frames('gem', (64, 64))
+            >>> frame = gem_frames[sprite_manager.current_frames['gem']]
+        """
+        return [self.get_sprite(sprite_name, size) for sprite_name in self.animations.get(animation_name, [])]
+    
     def get_player_sprite(self, direction: str, size: Optional[Tuple[int, int]] = None) -> Optional[pygame.Surface]:
         """
         Get current player sprite for the given direction.
@@ -359,17 +481,92 @@ class SpriteManager:
         Get particle sprite by color.
         
         Particles are static (no animation) but come in different colors.
+        The colors in PARTICLE_COLORS always exist: a plain circle is
+        generated at load time if the asset is missing.
         
         Args:
             color (str): Particle color ("gem_yellow", "goal_green", "player_blue")
             size (Optional[Tuple[int, int]]): Target size for scaling
         
         Returns:
-            Optional[pygame.Surface]: Particle sprite, or None if not found
+            Optional[pygame.Surface]: Particle sprite, or None for unknown colors
         """
         sprite_name = f"particle_{color}"
         return self.get_sprite(sprite_name, size)
     
+    def get_particle_sprites(self, color: str) -> List[pygame.Surface]:
+        """
+        Get a particle sprite at every diameter from 0 to PARTICLE_MAX_DIAMETER.
+        
+        Scales all sizes up front, so renderers can index the list by
+        int(particle.size * 2) without any per-particle lookup or check.
+        
+        Args:
+            color (str): Particle color ("gem_yellow", "goal_green", "player_blue")
+        
+        Returns:
+            List[pygame.Surface]: Sprites indexed by diameter in pixels
+        """
+        return [self.get_particle_sprite(color, (diameter, diameter))
+                for diameter in range(PARTICLE_MAX_DIAMETER + 1)]
+    
+    def get_faded_particle_sprites(self, color: str) -> List[List[pygame.Surface]]:
+        """
+        Get a particle sprite at every diameter and every alpha level.
+        
+        Builds the whole table up front so fading particles only index
+        it: table[diameter][alpha >> 4].
+        
+        Args:
+            color (str): Particle color ("gem_yellow", "goal_green", "player_blue")
+        
+        Returns:
+            List[List[pygame.Surface]]: Indexed by diameter (0 to
+            PARTICLE_MAX_DIAMETER), then by alpha bucket (0-15)
+        """
+        sprite_name = f"particle_{color}"
+        return [
+            [self.get_faded_sprite(sprite_name, (diameter, diameter), bucket << 4)
+             for bucket in range(16)]
+            for diameter in range(PARTICLE_MAX_DIAMETER + 1)
+        ]
+    
+    def get_faded_sprite(self, sprite_name: str, size: Optional[Tuple[int, int]] = None,
+                         alpha: int = 255) -> Optional[pygame.Surface]:
+        """
+        Get a sprite with a surface alpha applied, optionally scaled.
+        
+        Alpha is quantized to 16 levels and each level is cached as its
+        own copy, so callers can draw the same sprite at different
+        opacities in one frame (and batch them with Surface.blits())
+        without mutating the shared sprite. The fade is multiplied into
+        the copy's per-pixel alpha rather than set as surface alpha, so
+        blitting it is a plain per-pixel alpha blend.
+        
+        Args:
+            sprite_name (str): Sprite key (e.g., "particle_gem_yellow")
+            size (Optional[Tuple[int, int]]): Target size (width, height)
+            alpha (int): Opacity 0-255
+        
+        Returns:
+            Optional[pygame.Surface]: Faded sprite, or None if not found
+        """
+        bucket = max(0, min(255, alpha)) >> 4  # 16 levels
+        if bucket == 15:
+            return self.get_sprite(sprite_name, size)  # Fully opaque
+        
+        key = (sprite_name, size, bucket)
+        faded = self.faded_sprites.get(key)
+        if faded is None:
+            sprite = self.get_sprite(sprite_name, size)
+            if sprite is None:
+                return None
+            faded = sprite.copy()
+            # Bucket 0-15 -> alpha 0-255, premultiplied into each pixel
+            faded.fill((255, 255, 255, bucket * 17), special_flags=pygame.BLEND_RGBA_MULT)
+            self.faded_sprites[key] = faded
+        return faded
+    
     def is_loaded(self) -> bool:
         """
         Check if any sprites were successfully loaded.
@@ -381,5 +578,5 @@ class SpriteManager:
             >>> if not sprite_manager.is_loaded():
             ...     print("Warning: No sprites loaded, using fallback rendering")
         """
-        return len(self.sprites) > 0
+        return len(self.sprites) > len(self.generated_sprites)
 
@@ -59,6 +59,13 @@ def test_basic_functionality():
         assert level.get_total_gems() == 1
         print("✓ Level system working")
         
+        # Test bulk grid construction from a level
+        level_grid = Grid.from_level(level)
+        assert level_grid.is_wall(2, 2)
+        assert level_grid.is_gem(1, 1)
+        assert level_grid.goals == [(4, 4)]
+        print("✓ Grid.from_level working")
+        
         return True
         
     except Exception as e:
@@ -94,6 +101,229 @@ def test_code_execution():
         print(f"✗ Code execution test failed: {e}")
         return False
 
+def test_sandbox_escapes():
+    """Test that known sandbox escapes are rejected."""
+    from core.config import Config
+    from core.code_executor import CodeExecutor
+    from core.player import Player
+    from core.grid import Grid
+    
+    executor = CodeExecutor(Config())
+    
+    # Frame walk out of a generator, then calls hidden behind a subscript
+    frame_walk = (
+        "def g():\n"
+        "    fr = gen.gi_frame.f_back.f_back\n"
+        "    yield fr\n"
+        "gen = [g][0]()\n"
+        "for fr in gen:\n"
+        "    imp = fr.f_builtins['__import__']\n"
+        "    m = [imp][0]('os')\n"
+        "    leak = [m.getcwd][0]()"
+    )
+    assert not executor.validate_code(frame_walk)
+    result = executor.execute_code(frame_walk, Player(0, 0, "north"), Grid(5, 5))
+    assert not result.success
+    assert result.error.startswith("Security violation")
+    
+    for code in ("[move_forward][0]()", "(lambda: move_forward)()()",
+                 "x = (i for i in []).gi_code", "x = f.f_globals"):
+        assert not executor.validate_code(code), code
+    assert executor.validate_code("[move_forward][0]\nmove_forward()")
+    print("✓ Sandbox escapes blocked")
+    
+    return True
+
+def test_compiled_solution():
+    """Test compiling a solution once and running it on several grids."""
+    from core.config import Config
+    from core.code_executor import CodeExecutor
+    from core.player import Player
+    from core.grid import Grid
+    
+    executor = CodeExecutor(Config())
+    
+    # Syntax errors, compiler errors and forbidden code all give None
+    for code in ("x =", "return 1", "break", "nonlocal x", "yield 1", "import os"):
+        assert executor.compile_code(code) is None, code
+        assert not executor.validate_code(code), code
+    print("✓ Invalid code not compiled")
+    
+    solution = executor.compile_code("move_forward()\nturn_right()\nmove_forward()")
+    assert solution is not None
+    expected = ["move_forward", "turn_right", "move_forward"]
+    for start, end in (((0, 4), (1, 3)), ((2, 2), (3, 1))):
+        player = Player(start[0], start[1], "north")
+        result = executor.execute_compiled(solution, player, Grid(5, 5))
+        assert result.success
+        assert result.actions == expected
+        assert player.get_position() == end
+    print("✓ Compiled solution reused across grids")
+    
+    return True
+
+def test_execution_results():
+    """Test the ExecutionResult returned by execute_code()."""
+    import time
+    from core.config import Config
+    from core.code_executor import CodeExecutor
+    from core.player import Player
+    from core.grid import Grid
+    
+    executor = CodeExecutor(Config())
+    
+    def run(code):
+        return executor.execute_code(code, Player(0, 0, "north"), Grid(5, 5))
+    
+    # Valid code
+    result = run("move_forward()\nturn_right()")
+    assert result.success
+    assert result.actions == ["move_forward", "turn_right"]
+    assert result.error == ""
+    assert set(result.to_dict()) == {"success", "actions", "execution_time"}
+    
+    # Without action tracking the player still moves
+    player = Player(0, 0, "north")
+    result = executor.execute_code("move_forward()\nturn_right()\nmove_forward()",
+                                   player, Grid(5, 5), track_actions=False)
+    assert result.success
+    assert result.actions == []
+    assert player.get_position() == (1, -1)
+    print("✓ Valid code result working")
+    
+    # Forbidden import
+    result = run("import os")
+    assert not result.success
+    assert result.actions == []
+    assert result.error.startswith("Security violation")
+    assert result.to_dict() == {"success": False, "error": result.error, "actions": []}
+    print("✓ Forbidden code result working")
+    
+    # Runtime and syntax errors
+    result = run("move_forward()\nundefined_name")
+    assert not result.success
+    assert result.error == "NameError: name 'undefined_name' is not defined"
+    result = run("x =")
+    assert not result.success
+    assert result.error.startswith("SyntaxError: ")
+    print("✓ Error results working")
+    
+    # Infinite loop is interrupted once execution_timeout has passed
+    executor.execution_timeout = 0.2
+    start = time.perf_counter()
+    result = run("while True: pass")
+    assert time.perf_counter() - start < 2
+    assert not result.success
+    assert "timeout" in result.error
+    
+    # ...even when the student's code catches the interrupt and loops on
+    caught = "while True:\n    try:\n        while True:\n            n = 0\n            n = n + 1\n"
+    for code in (caught + "    except:\n        pass",
+                 caught + "    finally:\n        continue"):
+        start = time.perf_counter()
+        result = run(code)
+        assert time.perf_counter() - start < 2
+        assert not result.success
+        assert "timeout" in result.error
+    print("✓ Execution timeout working")
+    
+    return True
+
+def test_particle_backends():
+    """Test that both particle systems and all kernels agree."""
+    import core.animation as animation
+    from core import particle_kernel
+    
+    np = animation.np
+    if np is None:
+        print("- NumPy not installed, particle backend test skipped")
+        return True
+    
+    # Pure-Python loop and NumPy version always; the compiled loop
+    # whenever numba is installed (it is then the default kernel)
+    kernels = [particle_kernel._step_numpy, particle_kernel._step_loop]
+    if particle_kernel.HAS_NUMBA:
+        kernels.append(particle_kernel.step)
+    
+    default_rng = animation._rng
+    default_kernel = animation._step_particles
+    try:
+        for kernel in kernels:
+            animation._step_particles = kernel
+            list_system = animation.ListParticleSystem()
+            array_system = animation.ArrayParticleSystem()
+            
+            # Same fixed-seed bursts into both systems
+            for seed, (x, y), color in ((1, (100, 100), (255, 0, 0)),
+                                        (2, (300, 50), (0, 255, 0))):
+                for system in (list_system, array_system):
+                    animation._rng = np.random.default_rng(seed)
+                    system.emit(x, y, 200, color, speed=150)
+            
+            compacted = False
+            while len(list_system):
+                before = len(list_system)
+                list_system.update(0.05)
+                array_system.update(0.05)
+                assert len(array_system) == len(list_system)
+                # Lifetimes are random, so particles die mid-array
+                compacted |= 0 < len(list_system) < before
+                
+                xs, ys, sizes, _, colors = list_system.get_render_data()
+                array_xs, array_ys, array_sizes, _, array_colors = array_system.get_arrays()
+                assert np.allclose(array_xs, xs, rtol=1e-5, atol=1e-3)
+                assert np.allclose(array_ys, ys, rtol=1e-5, atol=1e-3)
+                assert np.allclose(array_sizes, sizes, rtol=1e-5, atol=1e-4)
+                assert array_colors.tolist() == [list(c) for c in colors]
+            assert compacted
+            assert len(array_system) == 0
+        
+        # Emitting past capacity caps the count and evicts the oldest
+        list_system = animation.ListParticleSystem(capacity=10)
+        array_system = animation.ArrayParticleSystem(capacity=10)
+        for system in (list_system, array_system):
+            system.emit(0, 0, 6, (255, 0, 0))
+            first = system.get_particles()
+            system.emit(50, 50, 6, (0, 0, 255))
+            assert len(system) == 10
+            kept = system.get_particles()
+            assert [p.vx for p in kept[:4]] == [p.vx for p in first[2:]]
+            assert [p.color for p in kept] == [(255, 0, 0)] * 4 + [(0, 0, 255)] * 6
+            system.emit(0, 0, 25, (0, 255, 0))
+            assert len(system) == 10
+            assert all(p.color == (0, 255, 0) for p in system.get_particles())
+    finally:
+        animation._rng = default_rng
+        animation._step_particles = default_kernel
+    print(f"✓ Particle backends match ({len(kernels)} kernels)")
+    print("✓ Particle capacity working")
+    
+    return True
+
+def test_animation_manager():
+    """Test that managed animations advance in place."""
+    from core.animation import Animation, AnimationManager, EasingType
+    
+    manager = AnimationManager()
+    slide = Animation(0, 100, 1.0, EasingType.LINEAR)
+    manager.add("slide", slide)
+    manager.add("blink", Animation(1.0, 0.0, 0.25, EasingType.LINEAR))
+    
+    manager.update(0.5)
+    # A reference held by the caller sees the update, not just get()
+    assert abs(slide.get_value() - 50.0) < 1e-9
+    assert abs(manager.animations["slide"].get_value() - 50.0) < 1e-9
+    assert manager.get("blink") is None  # Finished and removed
+    
+    # Removing directly from the dict leaves the manager usable
+    del manager.animations["slide"]
+    manager.update(0.1)
+    assert not manager.is_animating()
+    assert abs(slide.get_value() - 50.0) < 1e-9
+    print("✓ Animation manager working")
+    
+    return True
+
 def main():
     """Run all tests."""
     print("Testing Python Learning Game...")
@@ -102,12 +332,22 @@ def main():
     tests = [
         test_imports,
         test_basic_functionality,
-        test_code_execution
+        test_code_execution,
+        test_sandbox_escapes,
+        test_compiled_solution,
+        test_execution_results,
+        test_animation_manager,
+        test_particle_backends
     ]
     
     passed = 0
     for test in tests:
-        if test():
+        try:
+            ok = test()
+        except AssertionError as e:
+            print(f"✗ {test.__name__} failed: {e}")
+            ok = False
+        if ok:
             passed += 1
         print()
     
@@ -5,26 +5,57 @@ Usage: python view_sprite.py [sprite_name]
 Example: python view_sprite.py player_north_0
 """
 
+import json
 import pygame
 import sys
 from pathlib import Path
 
+SPRITES_DIR = Path(__file__).parent / "assets" / "sprites"
+
+
+def load_atlas_index(sprites_dir):
+    """Load the atlas index ({name: [x, y, w, h]}), or {} if there is no atlas."""
+    index_path = sprites_dir / "atlas.json"
+    if not index_path.exists():
+        return {}
+    with open(index_path, 'r') as f:
+        return json.load(f)
+
+
+def list_sprite_names(sprites_dir):
+    """List all sprite names, from the atlas index and any loose PNG files."""
+    names = set(load_atlas_index(sprites_dir))
+    names.update(p.stem for p in sprites_dir.glob("*.png") if p.stem != "atlas")
+    return sorted(names)
+
+
+def load_sprite(sprites_dir, sprite_name):
+    """Load a sprite from the atlas (or its own PNG file). Returns None if missing."""
+    index = load_atlas_index(sprites_dir)
+    if sprite_name in index:
+        atlas = pygame.image.load(str(sprites_dir / "atlas.png"))
+        return atlas.subsurface(pygame.Rect(index[sprite_name])).copy()
+    
+    sprite_path = sprites_dir / f"{sprite_name}.png"
+    if sprite_path.exists():
+        return pygame.image.load(str(sprite_path))
+    return None
+
+
 def view_sprite(sprite_name):
     """View a sprite enlarged."""
     pygame.init()
     
-    sprites_dir = Path(__file__).parent / "assets" / "sprites"
-    sprite_path = sprites_dir / f"{sprite_name}.png"
+    sprites_dir = SPRITES_DIR
+    sprite = load_sprite(sprites_dir, sprite_name)
     
-    if not sprite_path.exists():
-        print(f"❌ Sprite not found: {sprite_path}")
+    if sprite is None:
+        print(f"❌ Sprite not found: {sprite_name}")
         print(f"\nAvailable sprites in {sprites_dir}:")
-        for sprite_file in sorted(sprites_dir.glob("*.png")):
-            print(f"  - {sprite_file.stem}")
+        for name in list_sprite_names(sprites_dir):
+            print(f"  - {name}")
         return
     
-    # Load sprite
-    sprite = pygame.image.load(str(sprite_path))
     original_size = sprite.get_size()
     
     # Scale up for viewing
@@ -103,9 +134,9 @@ def main():
         print("  python view_sprite.py tile_wall")
         print("\nAvailable sprites:")
         
-        sprites_dir = Path(__file__).parent / "assets" / "sprites"
+        sprites_dir = SPRITES_DIR
         if sprites_dir.exists():
-            sprites = sorted(sprites_dir.glob("*.png"))
+            sprites = list_sprite_names(sprites_dir)
             
             # Group by category
             categories = {
@@ -116,8 +147,7 @@ def main():
                 'Particles': []
             }
             
-            for sprite_file in sprites:
-                name = sprite_file.stem
+            for name in sprites:
                 if name.startswith('player_'):
                     categories['Player'].append(name)
                 elif name.startswith('tile_'):